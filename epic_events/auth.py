@@ -39,6 +39,9 @@ class SessionContext:
     - Serve as a basis for permission checks
 
     It deliberately avoids any dependency on the database layer.
+
+    `auth_epoch` is bumped whenever the role or the authentication state changes,
+    so permission checks cached for a session can tell when they become stale.
     """
 
     SESSION_TIMEOUT = timedelta(minutes=15)
@@ -50,12 +53,31 @@ class SessionContext:
             role: str,
             is_authenticated: bool = False
     ):
+        self.auth_epoch = 0
         self.username = username
         self.user_id = user_id
         self.role = role
         self.is_authenticated = is_authenticated
         self.created_at = datetime.now()
 
+    @property
+    def role(self) -> str:
+        return self._role
+
+    @role.setter
+    def role(self, value: str):
+        self._role = value
+        self.auth_epoch += 1
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._is_authenticated
+
+    @is_authenticated.setter
+    def is_authenticated(self, value: bool):
+        self._is_authenticated = value
+        self.auth_epoch += 1
+
     def is_expired(self) -> bool:
         """
         Checks whether the session has expired based on its creation time.
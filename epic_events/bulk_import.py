@@ -0,0 +1,236 @@
+"""
+Bulk import script to seed the CRM from CSV files.
+
+Creating records one by one through the CRM menus runs a full unit of work
+(validation probes, INSERT, COMMIT) per record. This script loads a whole CSV
+file and inserts its rows with the models' create_many methods, i.e. a single
+executemany INSERT and a single COMMIT.
+
+The CSV header must use the column names of the target table (e.g. first_name,
+email, commercial_contact_id). For users, a plain text `password` column is
+hashed into `password_hash`. Empty cells are imported as NULL.
+
+Security principles:
+- Meant for trusted seed data: only the checks done by create_many (uniqueness
+  of usernames and emails) and the database constraints are applied
+- Passwords are hashed with the same mechanism as the application
+- Not accessible from the main application workflow
+"""
+
+import csv
+import sys
+from datetime import datetime
+from itertools import islice
+from decimal import Decimal, InvalidOperation
+
+import click
+from sqlalchemy import Boolean, DateTime, DECIMAL, Integer
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from epic_events.database import SessionLocal
+from epic_events.models import User, Client, Contract, Event
+from epic_events.auth import hash_password
+from epic_events.utils import ErrorMessages
+
+MODELS = {
+    "users": User,
+    "clients": Client,
+    "contracts": Contract,
+    "events": Event,
+}
+
+_DT_FORMAT = "%Y-%m-%d %H:%M"
+
+
+class CsvRowError(ValueError):
+    """
+    Raised when a cell of the CSV file cannot be converted to its column type
+    (or when a user row has an empty password).
+
+    Rows are converted lazily, while the import is running: this error carries the
+    location of the bad cell, so that it is reported as an invalid file and not
+    mistaken for a validation error of the models (ErrorMessages keys).
+
+    Attributes:
+        line (int): Line number of the row in the CSV file.
+        column (str): Name of the column.
+        value (str): The cell text.
+        reason (str, optional): Description of the problem, instead of the default "invalid value".
+    """
+
+    def __init__(self, line: int, column: str, value: str, reason: str = None):
+        super().__init__(f"line {line}, column {column}: {reason or f'invalid value {value!r}'}")
+        self.line = line
+        self.column = column
+        self.value = value
+        self.reason = reason
+
+
+def _to_decimal(value: str) -> Decimal:
+    """
+    Converts a cell to a Decimal, raising ValueError (like int) on invalid text.
+
+    Args:
+        value (str): The cell text.
+
+    Returns:
+        Decimal: The parsed amount.
+    """
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(value) from None
+
+
+def _converter(column_type):
+    """
+    Returns the function converting a CSV cell to the Python type of a column.
+
+    Args:
+        column_type: SQLAlchemy type of the column.
+
+    Returns:
+        callable: Converter taking the (non-empty) cell text.
+    """
+    if isinstance(column_type, Boolean):
+        return lambda value: value.strip().lower() in ("1", "true", "yes")
+    if isinstance(column_type, Integer):
+        return int
+    if isinstance(column_type, DECIMAL):
+        return _to_decimal
+    if isinstance(column_type, DateTime):
+        return lambda value: datetime.strptime(value, _DT_FORMAT)
+    return str
+
+
+def read_rows(model, csv_file):
+    """
+    Reads an open CSV file into rows ready for model.create_many.
+
+    The header is checked upfront; rows are then converted lazily, one at a time,
+    so that a large file never has to be held in memory as a whole.
+
+    Args:
+        model: The mapped class the rows belong to.
+        csv_file: The CSV file, opened in text mode with newline="".
+
+    Raises:
+        ValueError: If the header contains a column unknown to the table.
+        CsvRowError: While iterating, if a cell cannot be converted to its column type,
+                     or if a user row has an empty password.
+
+    Returns:
+        Iterator[dict]: Column values of each row, keyed by column name.
+    """
+    columns = model.__table__.columns
+    reader = csv.DictReader(csv_file)
+    fields = list(reader.fieldnames or [])
+    if model is User and "password" in fields:
+        fields.remove("password")
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise ValueError(f"Unknown column(s) for {model.__tablename__}: {', '.join(unknown)}")
+
+    # Converters are resolved once per column, not once per cell
+    converters = {field: _converter(columns[field].type) for field in fields}
+
+    def rows():
+        for record in reader:
+            row = {}
+            for field, convert in converters.items():
+                value = record[field]
+                try:
+                    row[field] = convert(value) if value else None
+                except ValueError:
+                    raise CsvRowError(reader.line_num, field, value) from None
+            if model is User and "password" in record:
+                if not record["password"]:
+                    raise CsvRowError(reader.line_num, "password", "", reason="password must not be empty")
+                row["password_hash"] = hash_password(record["password"])
+            yield row
+
+    return rows()
+
+
+def chunked(rows, chunk_size: int):
+    """
+    Groups rows into lists of at most chunk_size rows.
+
+    Args:
+        rows (Iterable[dict]): Rows to group.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Returns:
+        Iterator[list[dict]]: The successive chunks.
+    """
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+@click.command()
+@click.argument("table", type=click.Choice(list(MODELS)))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--chunk-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of rows read and inserted per executemany batch."
+)
+def bulk_import(table: str, path: str, chunk_size: int) -> None:
+    """
+    Import the rows of a CSV file into TABLE in a single transaction.
+
+    Rows are inserted in batches of --chunk-size to bound memory use on large
+    files; the import is committed once at the end, so either every row is
+    inserted or none is.
+    """
+    model = MODELS[table]
+
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        try:
+            rows = read_rows(model, csv_file)
+        except ValueError as error:
+            click.echo(f"❌ Invalid CSV file: {error}")
+            sys.exit(1)
+
+        db = SessionLocal()
+        imported = 0
+        try:
+            # Each batch is checked against the database, which already holds the previous batches
+            for chunk in chunked(rows, chunk_size):
+                model.create_many(db, chunk)
+                imported += len(chunk)
+            db.commit()
+            click.echo(f"✅ {imported} {table} imported.")
+
+        except CsvRowError as error:
+            db.rollback()
+            click.echo(f"❌ Invalid CSV file: {error}")
+            sys.exit(1)
+
+        except ValueError as error:
+            db.rollback()
+            click.echo(f"❌ Import failed: {ErrorMessages.get_message(str(error))}")
+            sys.exit(1)
+
+        except IntegrityError:
+            db.rollback()
+            click.echo("❌ Import failed: a row violates a database constraint (unknown reference or duplicate).")
+            sys.exit(1)
+
+        except OperationalError:
+            db.rollback()
+            click.echo(
+                "❌ Database operation failed. "
+                "Ensure that the database schema has been initialized."
+            )
+            sys.exit(1)
+
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    bulk_import()
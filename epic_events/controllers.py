@@ -1,15 +1,37 @@
 from epic_events.models import User, Client, Contract, Event
 from epic_events.views import (DisplayMessages, UserView, ClientView, ContractView, EventView, MenuView, LoginView)
 from epic_events.auth import hash_password, verify_password, SessionContext
-from epic_events.database import SessionLocal
+from epic_events.database import CliSession
+from epic_events.request_cache import request_scope
 from epic_events.permissions import requires_authentication, management_only, support_only, commercial_only, \
     role_permission
 
+from sqlalchemy.exc import IntegrityError
 from dotenv import load_dotenv
 import os
 import sentry_sdk
 
 
+def _missing_reference_error(db, client_id=None, contact_id=None):
+    """
+    Identifies which referenced row is missing after a foreign key violation.
+    Only called once an INSERT has been rejected, so valid creations pay no extra lookup.
+
+    Args:
+        db (sqlalchemy.orm.Session): Active database session (already rolled back).
+        client_id (int, optional): Referenced client ID to check.
+        contact_id (int, optional): Referenced user ID to check.
+
+    Returns:
+        str | None: "CLIENT_NOT_FOUND" or "CONTACT_NOT_FOUND", or None if both references exist.
+    """
+    if client_id is not None and Client.get_by_id(db, client_id) is None:
+        return "CLIENT_NOT_FOUND"
+    if contact_id is not None and User.get_by_id(db, contact_id) is None:
+        return "CONTACT_NOT_FOUND"
+    return None
+
+
 class MenuController:
     """Static methods for handling menu navigation and controller delegation."""
 
@@ -26,14 +48,9 @@ class MenuController:
         """
         while True:
             choice = MenuView.display_main_menu(session)
-            if choice == "1":
-                MenuController.run_users_menu(db, session)
-            elif choice == "2":
-                MenuController.run_clients_menu(db, session)
-            elif choice == "3":
-                MenuController.run_contracts_menu(db, session)
-            elif choice == "4":
-                MenuController.run_events_menu(db, session)
+            submenu = _MAIN_MENU_ACTIONS.get(choice)
+            if submenu is not None:
+                submenu(db, session)
             elif choice == "5":
                 if LoginController.logout(session):
                     DisplayMessages.display_goodbye()
@@ -41,82 +58,101 @@ class MenuController:
             else:
                 DisplayMessages.display_invalid_choice("main")
 
+    @staticmethod
+    def _run_submenu(db, session, display_menu, actions, menu_name):
+        """
+        Runs a submenu loop, dispatching each choice through its action table.
+
+        Args:
+            db (sqlalchemy.orm.Session): Database session for data operations.
+            session (SessionContext): Authentication context of the currently logged-in user.
+            display_menu (callable): Displays the submenu and returns the user's choice.
+            actions (dict): Maps each choice to a controller action, or to None for "back".
+            menu_name (str): Name of the submenu, used in the invalid choice message.
+        """
+        while True:
+            choice = display_menu()
+            if choice not in actions:
+                DisplayMessages.display_invalid_choice(menu_name)
+                continue
+
+            action = actions[choice]
+            if action is None:
+                break
+            with request_scope():
+                action(db, session)
+
     @staticmethod
     @management_only
     def run_users_menu(db, session):
         """Runs the Users submenu loop and delegates actions to UserController."""
-        while True:
-            choice = MenuView.display_users_menu()
-            if choice == "1":
-                UserController.create_user(db, session)
-            elif choice == "2":
-                UserController.update_user(db, session)
-            elif choice == "3":
-                UserController.delete_user(db, session)
-            elif choice == "4":
-                break
-            else:
-                DisplayMessages.display_invalid_choice("users")
+        MenuController._run_submenu(db, session, MenuView.display_users_menu, _USERS_MENU_ACTIONS, "users")
 
     @staticmethod
     @requires_authentication
     def run_clients_menu(db, session):
         """Runs the Clients submenu loop and delegates actions to ClientController."""
-        while True:
-            choice = MenuView.display_clients_menu(session)
-            if choice == "1":
-                ClientController.list_clients(db, session)
-            elif choice == "2":
-                ClientController.create_client(db, session)
-            elif choice == "3":
-                ClientController.update_client(db, session)
-            elif choice == "4":
-                break
-            else:
-                DisplayMessages.display_invalid_choice("clients")
+        MenuController._run_submenu(
+            db, session, lambda: MenuView.display_clients_menu(session), _CLIENTS_MENU_ACTIONS, "clients"
+        )
 
     @staticmethod
     @requires_authentication
     def run_contracts_menu(db, session):
         """Runs the Contracts submenu loop and delegates actions to ContractController."""
-        while True:
-            choice = MenuView.display_contracts_menu(session)
-            if choice == "1":
-                ContractController.list_contracts(db, session)
-            elif choice == "2":
-                ContractController.create_contract(db, session)
-            elif choice == "3":
-                ContractController.update_contract(db, session)
-            elif choice == "4":
-                ContractController.list_pending_contracts(db, session)
-            elif choice == "5":
-                break
-            else:
-                DisplayMessages.display_invalid_choice("contracts")
+        MenuController._run_submenu(
+            db, session, lambda: MenuView.display_contracts_menu(session), _CONTRACTS_MENU_ACTIONS, "contracts"
+        )
 
     @staticmethod
     @requires_authentication
     def run_events_menu(db, session):
         """Runs the Events submenu loop and delegates actions to EventController."""
-        while True:
-            choice = MenuView.display_events_menu(session)
-            if choice == "1":
-                EventController.list_events(db, session)
-            elif choice == "2":
-                EventController.create_event(db, session)
-            elif choice == "3":
-                EventController.update_event(db, session)
-            elif choice == "4":
-                EventController.list_assigned_events(db, session)
-            elif choice == "5":
-                EventController.list_unassigned_events(db, session)
-            elif choice == "6":
-                EventController.assign_support(db, session)
-            elif choice == "7":
-                break
+        MenuController._run_submenu(
+            db, session, lambda: MenuView.display_events_menu(session), _EVENTS_MENU_ACTIONS, "events"
+        )
 
-            else:
-                DisplayMessages.display_invalid_choice("events")
+
+# Menu dispatch tables: choice -> action(db, session), None meaning "back to the main menu".
+# Actions look the controller method up when called, so they always reach its current definition.
+_MAIN_MENU_ACTIONS = {
+    "1": lambda db, session: MenuController.run_users_menu(db, session),
+    "2": lambda db, session: MenuController.run_clients_menu(db, session),
+    "3": lambda db, session: MenuController.run_contracts_menu(db, session),
+    "4": lambda db, session: MenuController.run_events_menu(db, session),
+}
+
+_USERS_MENU_ACTIONS = {
+    "1": lambda db, session: UserController.create_user(db, session),
+    "2": lambda db, session: UserController.update_user(db, session),
+    "3": lambda db, session: UserController.delete_user(db, session),
+    "4": None,
+}
+
+_CLIENTS_MENU_ACTIONS = {
+    "1": lambda db, session: ClientController.list_clients(db, session),
+    "2": lambda db, session: ClientController.create_client(db, session),
+    "3": lambda db, session: ClientController.update_client(db, session),
+    "4": None,
+}
+
+_CONTRACTS_MENU_ACTIONS = {
+    "1": lambda db, session: ContractController.list_contracts(db, session),
+    "2": lambda db, session: ContractController.create_contract(db, session),
+    "3": lambda db, session: ContractController.update_contract(db, session),
+    "4": lambda db, session: ContractController.list_pending_contracts(db, session),
+    "5": None,
+}
+
+_EVENTS_MENU_ACTIONS = {
+    "1": lambda db, session: EventController.list_events(db, session),
+    "2": lambda db, session: EventController.create_event(db, session),
+    "3": lambda db, session: EventController.update_event(db, session),
+    "4": lambda db, session: EventController.list_assigned_events(db, session),
+    "5": lambda db, session: EventController.list_unassigned_events(db, session),
+    "6": lambda db, session: EventController.assign_support(db, session),
+    "7": None,
+}
 
 
 class LoginController:
@@ -278,6 +314,15 @@ class UserController:
             db.rollback()
             DisplayMessages.display_error(str(e))
 
+        except IntegrityError:
+            # Handle unique constraint violations (username or email taken by a concurrent creation)
+            db.rollback()
+            error = User.get_identity_conflict(db, user_data["username"], user_data["email"])
+            if error is None:
+                DisplayMessages.display_error("DATABASE_ERROR")
+                raise
+            DisplayMessages.display_error(error)
+
         except Exception:
             # Handle database/technical errors
             db.rollback()
@@ -328,7 +373,7 @@ class UserController:
         """
         try:
             # Step 1: Prompt for user ID and updated data
-            users = User.get_all(db)
+            users = User.get_id_list(db)
             UserView.display_user_id_list(users)
             user_id = MenuView.prompt_for_id("user")
             user = User.get_by_id(db, user_id)
@@ -391,7 +436,7 @@ class UserController:
           1. Prompts the user for the user ID (via MenuView.prompt_for_id).
           2. Retrieves the user from the database (via User.get_by_id).
           3. Asks for confirmation (via UserView.prompt_delete_confirmation).
-          4. Deletes the user (via db.delete) and handles transactions.
+          4. Deletes the user (via User.delete) and handles transactions.
           5. Delegates success/error feedback to the view.
 
         Args:
@@ -402,7 +447,7 @@ class UserController:
         """
         try:
             # Step 1: Prompt for user ID
-            users = User.get_all(db)
+            users = User.get_id_list(db)
             UserView.display_user_id_list(users)
             user_id = MenuView.prompt_for_id("user")
 
@@ -417,14 +462,11 @@ class UserController:
                 DisplayMessages.display_success("Deletion cancelled.")
                 return
 
-            # Step 4: Handle dependencies
+            # Step 4: Delete the user (the database dissociates its clients, contracts and events)
             user.delete(db)
-
-            # Step 5: Delete the user and handle transaction
-            db.delete(user)
             db.commit()
 
-            # Step 6: Display success
+            # Step 5: Display success
             DisplayMessages.display_success(
                 f"User deleted: {user.username} (ID: {user.user_id})"
             )
@@ -459,7 +501,7 @@ class ClientController:
             Contains identity and role information used for permission checks.
 
         Workflow:
-            1. Retrieves all clients from the database (via Client.get_all).
+            1. Streams all clients from the database in batches (via Client.iter_all).
             2. Delegates the display of clients to the view layer (via ClientView.list_clients).
             3. Handles any unexpected errors and provides feedback via DisplayMessages.
 
@@ -470,8 +512,8 @@ class ClientController:
         """
 
         try:
-            # Step 1: Retrieve clients from the database (model layer)
-            clients = Client.get_all(db)
+            # Step 1: Stream clients from the database in batches (model layer)
+            clients = Client.iter_all(db)
 
             # Step 2: Delegate display to the view layer
             ClientView.list_clients(clients)
@@ -542,6 +584,15 @@ class ClientController:
             db.rollback()
             DisplayMessages.display_error(str(e))
 
+        except IntegrityError:
+            # Handle foreign key violations (commercial contact does not exist)
+            db.rollback()
+            error = _missing_reference_error(db, contact_id=session.user_id)
+            if error is None:
+                DisplayMessages.display_error("DATABASE_ERROR")
+                raise
+            DisplayMessages.display_error(error)
+
         except Exception:
             # Handle database/technical errors
             db.rollback()
@@ -625,7 +676,7 @@ class ContractController:
             Contains identity and role information used for permission checks.
 
         Workflow:
-            1. Retrieves all contracts from the database (via Contract.get_all).
+            1. Streams all contracts from the database in batches (via Contract.iter_all).
             2. Delegates the display of contracts to the view layer (via ContractView.list_contracts).
             3. Handles any unexpected errors and provides feedback via DisplayMessages.
 
@@ -635,8 +686,8 @@ class ContractController:
             - Re-raises the exception for potential higher-level handling (e.g., logging).
         """
         try:
-            # Step 1: Retrieve contracts from the database (model layer)
-            contracts = Contract.get_all(db)
+            # Step 1: Stream contracts from the database in batches (model layer)
+            contracts = Contract.iter_all(db)
 
             # Step 2: Delegate display to the view layer
             ContractView.list_contracts(contracts)
@@ -717,6 +768,19 @@ class ContractController:
             db.rollback()
             DisplayMessages.display_error(str(e))
 
+        except IntegrityError:
+            # Handle foreign key violations (client or commercial contact does not exist)
+            db.rollback()
+            error = _missing_reference_error(
+                db,
+                client_id=contract_data["client_id"],
+                contact_id=contract_data["commercial_contact_id"]
+            )
+            if error is None:
+                DisplayMessages.display_error("DATABASE_ERROR")
+                raise
+            DisplayMessages.display_error(error)
+
         except Exception:
             # Handle database/technical errors
             db.rollback()
@@ -763,7 +827,7 @@ class ContractController:
         try:
             # Step 1: Prompt for contract ID
             contract_id = MenuView.prompt_for_id("contract")
-            contract = Contract.get_by_id(db, contract_id)
+            contract = Contract.get_by_id(db, contract_id, with_related=True)
             if not contract:
                 DisplayMessages.display_error("CONTRACT_NOT_FOUND")
                 return
@@ -842,13 +906,13 @@ class EventController:
             Contains identity and role information used for permission checks.
 
         Workflow:
-            1. Retrieves all events from the database (via Event.get_all).
+            1. Streams all events from the database in batches (via Event.iter_all).
             2. Delegates the display of events to the view layer (via EventView.list_events).
             3. Handles any unexpected errors and provides feedback via DisplayMessages.
         """
         try:
-            # Step 1: Retrieve events from the database (model layer)
-            events = Event.get_all(db)
+            # Step 1: Stream events from the database in batches (model layer)
+            events = Event.iter_all(db)
 
             # Step 2: Delegate display to the view layer
             EventView.list_events(events)
@@ -907,7 +971,7 @@ class EventController:
             event_data = EventView.prompt_event_creation()
 
             # Step 1b: Check that the commercial is assigned to this client
-            client = db.query(Client).filter_by(client_id=event_data["client_id"]).first()
+            client = db.query(Client.commercial_contact_id).filter_by(client_id=event_data["client_id"]).first()
             if not client:
                 raise ValueError("CLIENT_NOT_FOUND")
             if client.commercial_contact_id != session.user_id:
@@ -1026,7 +1090,7 @@ class EventController:
                 raise ValueError("EVENT_NOT_FOUND")
 
             support_id = MenuView.prompt_for_contact_id("support user")
-            support_user = db.query(User).filter_by(user_id=support_id).first()
+            support_user = db.query(User.username).filter_by(user_id=support_id).first()
             if not support_user:
                 raise ValueError("CONTACT_NOT_FOUND")
 
@@ -1060,12 +1124,16 @@ if __name__ == "__main__":
     )
 
     # Initialize db and auth session
-    db = SessionLocal()
+    db = CliSession()
 
-    session = LoginController.login(db)
+    try:
+        session = LoginController.login(db)
 
-    if not session or not session.is_authenticated:
-        DisplayMessages.display_error("AUTHENTICATION_REQUIRED")
-        exit()
+        if not session or not session.is_authenticated:
+            DisplayMessages.display_error("AUTHENTICATION_REQUIRED")
+            exit()
 
-    MenuController.run_main_menu(db, session)
+        MenuController.run_main_menu(db, session)
+    finally:
+        # Close the session and return its connection to the pool
+        CliSession.remove()
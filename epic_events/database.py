@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, NullPool
+from sqlalchemy.orm import sessionmaker, scoped_session
 from dotenv import load_dotenv
 
 from epic_events.models import Base
@@ -12,13 +13,39 @@ SQLALCHEMY_DATABASE_URL = (f"mysql+mysqlconnector://{os.getenv('DB_USER')}:{os.g
 
 
 def get_engine():
-    return create_engine(SQLALCHEMY_DATABASE_URL)
+    """
+    Creates the engine with a pool of reusable connections, so that the many small
+    queries issued by the models do not each pay the MySQL connect/auth handshake.
+
+    The pool can be tuned from the environment (.env):
+        - DB_POOL_SIZE (default 10), DB_MAX_OVERFLOW (default 20),
+          DB_POOL_TIMEOUT (default 30s), DB_POOL_RECYCLE (default 1800s)
+        - DB_NULL_POOL: when set to 1, true or yes, connections are not pooled at all, which suits
+          one-shot scripts (e.g. create_admin.py, bulk_import.py) that never reuse one.
+    """
+    if os.getenv("DB_NULL_POOL", "").lower() in {"1", "true", "yes"}:
+        return create_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
+    return create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=QueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_pre_ping=True,
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    )
 
 
 engine = get_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session of the interactive CLI: one per thread for the whole run, so that CliSession() hands
+# back the same session (and its pooled connection), and CliSession.remove() closes it at shutdown.
+# Scripts (create_admin.py, bulk_import.py) keep opening and closing their own SessionLocal().
+CliSession = scoped_session(SessionLocal)
+
 
 def init_db():
     """Create all database tables."""
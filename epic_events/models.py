@@ -1,11 +1,266 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, DECIMAL, Boolean, Text, Enum, or_
-from sqlalchemy.orm import relationship, Session
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, DECIMAL, Boolean, Text, Enum, or_, insert, \
+    exists, select, bindparam
+from sqlalchemy.orm import relationship, Session, selectinload, raiseload, joinedload
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
-from epic_events.utils import ErrorMessages
+import os
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from epic_events.utils import ErrorMessages, ROLES
+from epic_events.request_cache import get_request_cache
 
 Base = declarative_base()
 
+# Precision of the DECIMAL(10, 2) amount columns
+_CENTS = Decimal("0.01")
+
+# Set of the user roles (utils.ROLES), for O(1) role validation
+_VALID_ROLES = frozenset(ROLES)
+
+
+def _exists(db: Session, statement, **params) -> bool:
+    """
+    Runs one of the precompiled SELECT EXISTS(...) probes defined at the bottom of this module.
+
+    The database only returns a boolean, without fetching and hydrating a full ORM object.
+    Autoflush is suspended during the probe: validating one object must not flush the
+    other pending changes of the session (e.g. objects queued by a bulk seeder).
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        statement: A precompiled probe (e.g. _CLIENT_EXISTS).
+        **params: Values of the probe's bound parameters (e.g. user_id=1).
+
+    Returns:
+        bool: True if a matching row exists, False otherwise.
+    """
+    with db.no_autoflush:
+        return db.execute(statement, params).scalar()
+
+
+def _has_duplicates(db: Session, column, values) -> bool:
+    """
+    Tells whether a batch of values for a unique column collides, either within the
+    batch itself or with a row already stored.
+
+    The whole batch is checked against the database with a single SELECT ... IN query.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        column: The unique column (e.g. User.email).
+        values (Iterable): The values about to be inserted (None values are ignored).
+
+    Returns:
+        bool: True if a value is repeated in the batch or already taken.
+    """
+    batch = [value for value in values if value is not None]
+    unique_values = set(batch)
+    if len(unique_values) != len(batch):
+        return True
+    if not unique_values:
+        return False
+    with db.no_autoflush:
+        return db.execute(select(column).where(column.in_(unique_values)).limit(1)).first() is not None
+
+
+def _is_loaded(db: Session, model, pk) -> bool:
+    """
+    Tells whether a row is already present in the session's identity map.
+
+    Such a row is known to exist, so the caller can skip its existence probe
+    without any round-trip to the database.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        model: The mapped class of the row.
+        pk (int): The primary key of the row.
+
+    Returns:
+        bool: True if the row is loaded in the session and not marked for deletion.
+    """
+    if pk is None:
+        return False
+    obj = db.identity_map.get(identity_key(model, pk))
+    return obj is not None and obj not in db.deleted
+
+
+def _missing_reference(db: Session, client_id=None, user_id=None):
+    """
+    Checks that the referenced client and user exist, with at most one round-trip.
+
+    Rows already loaded in the session are known to exist and are not probed;
+    the remaining ones are checked together by a single SELECT of two EXISTS.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        client_id (int, optional): Client ID to check, or None to skip it.
+        user_id (int, optional): User ID to check, or None to skip it.
+
+    Returns:
+        str | None: CLIENT_NOT_FOUND or CONTACT_NOT_FOUND (client checked first), or None if both exist.
+    """
+    check_client = client_id is not None and not _is_loaded(db, Client, client_id)
+    check_user = user_id is not None and not _is_loaded(db, User, user_id)
+    if not (check_client or check_user):
+        return None
+
+    with db.no_autoflush:
+        found = db.execute(_CLIENT_AND_USER_EXIST, {"client_id": client_id, "user_id": user_id}).one()
+    if check_client and not found.client_exists:
+        return ErrorMessages.CLIENT_NOT_FOUND.name
+    if check_user and not found.user_exists:
+        return ErrorMessages.CONTACT_NOT_FOUND.name
+    return None
+
+
+def _too_long(model, **values) -> bool:
+    """
+    Tells whether a text value does not fit in its String(n) column.
+
+    Checked before persisting, so that MySQL does not reject the row with a
+    "Data too long" error that could only be reported as DATABASE_ERROR.
+
+    Args:
+        model: The mapped class owning the columns.
+        **values: Column values keyed by column name (None values are ignored).
+
+    Returns:
+        bool: True if a value is longer than its column allows.
+    """
+    columns = model.__table__.columns
+    return any(
+        isinstance(value, str) and len(value) > columns[field].type.length
+        for field, value in values.items()
+    )
+
+
+def _to_amount(value) -> Decimal:
+    """
+    Converts an amount to a Decimal rounded to the cent, matching the DECIMAL(10, 2) columns.
+
+    Going through str() keeps the value the user typed (e.g. 0.1) instead of the
+    binary float approximation, so every later comparison is exact fixed-point.
+
+    Args:
+        value (float | Decimal | int): The amount to convert.
+
+    Returns:
+        Decimal: The amount rounded half-up to two decimal places.
+
+    Raises:
+        ValueError: INVALID_AMOUNT if the value is not a finite number (e.g. NaN or infinity).
+    """
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(ErrorMessages.INVALID_AMOUNT.name) from None
+    if not amount.is_finite():
+        raise ValueError(ErrorMessages.INVALID_AMOUNT.name)
+    return amount.quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+
+def _is_in_past(value: datetime) -> bool:
+    """
+    Tells whether a datetime is earlier than the current instant.
+
+    Both sides are compared in UTC: naive values (as stored in the DateTime columns)
+    are taken as local time, so the check stays correct across DST transitions.
+
+    Args:
+        value (datetime): The datetime to check, naive (local time) or timezone-aware.
+
+    Returns:
+        bool: True if the datetime is in the past.
+    """
+    return value.astimezone(timezone.utc) < datetime.now(timezone.utc)
+
+
+def _to_local_naive(value: datetime | None) -> datetime | None:
+    """
+    Converts a timezone-aware datetime to naive local time, as stored in the DateTime columns.
+
+    Naive values (and None) are returned unchanged, so that every later comparison
+    with a value read from the database is between naive datetimes.
+
+    Args:
+        value (datetime | None): The datetime to convert.
+
+    Returns:
+        datetime | None: The naive local datetime, or None.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _list_loading(*relationships):
+    """
+    Builds the loader options of the list queries.
+
+    The relationships shown by the list views are loaded with selectinload (one extra
+    SELECT ... IN per relationship, instead of one SELECT per row). When the
+    EPIC_STRICT_LOADING environment variable is set (e.g. in development or CI), any
+    other relationship is configured with raiseload, so that an accidental lazy load
+    from a list view raises instead of silently issuing one query per row.
+
+    Args:
+        *relationships: Relationship attributes to load eagerly.
+
+    Returns:
+        list: Loader options to pass to Query.options().
+    """
+    options = [selectinload(relationship_attribute) for relationship_attribute in relationships]
+    if os.getenv("EPIC_STRICT_LOADING"):
+        options.append(raiseload("*"))
+    return options
+
+
+def _cached_get_by_id(db: Session, model, pk, options=()):
+    """
+    Fetches a row by primary key, memoizing it in the active request cache.
+
+    Uses Session.get, which returns an object already present in the identity map
+    without emitting SQL and only queries the database on a miss.
+
+    Inside a request scope (see epic_events.request_cache), found objects are
+    cached under (session, table name, primary key), so repeated lookups of the same
+    row issue a single SELECT. The session is part of the key: an instance is only
+    ever handed back to the session it is attached to. Outside a request scope the
+    database is always queried.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        model: The mapped class to query.
+        pk (int): The primary key value to look up.
+        options (tuple): Loader options applied when the row is actually loaded.
+
+    Returns:
+        The model instance if found, None otherwise.
+    """
+    cache = get_request_cache()
+    key = (id(db), model.__tablename__, pk)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    obj = db.get(model, pk, options=options) if pk is not None else None
+    if cache is not None and obj is not None:
+        cache[key] = obj
+    return obj
+
+
+def _evict_from_request_cache(db: Session, model, pk):
+    """
+    Drops a row from the active request cache after it was updated or deleted.
+
+    Args:
+        db (Session): SQLAlchemy database session the row was loaded in.
+        model: The mapped class of the row.
+        pk (int): The primary key of the row.
+    """
+    cache = get_request_cache()
+    if cache is not None:
+        cache.pop((id(db), model.__tablename__, pk), None)
+
 
 class User(Base):
     """
@@ -13,12 +268,13 @@ class User(Base):
 
         Attributes:
             user_id (int): Primary key and unique identifier for the user, auto-incremented.
-            first_name (str): User's first name (max 100 characters).
-            last_name (str): User's last name (max 100 characters).
+            first_name (str): User's first name (max 64 characters).
+            last_name (str): User's last name (max 64 characters).
             username (str): Unique username for authentication (max 100 characters).
-            password_hash (str): Hashed password for authentication (max 100 characters).
+            password_hash (str): Hashed password for authentication (max 255 characters).
             email (str): Unique email address of the user.
-            role (str): Role of the user (commercial/management/support).
+            role (str): Role of the user (commercial/management/support),
+                        stored as a native database ENUM named "user_role".
 
         Relationships:
             clients (list[Client]): List of clients managed by the user (one-to-many).
@@ -30,17 +286,19 @@ class User(Base):
 
     # Columns definition
     user_id = Column(Integer, primary_key=True, index=True, nullable=False)
-    first_name = Column(String(100))
-    last_name = Column(String(100))
+    first_name = Column(String(64))
+    last_name = Column(String(64))
     username = Column(String(100), unique=True, index=True)
-    password_hash = Column(String(100), nullable=False)
+    password_hash = Column(String(255), nullable=False)
     email = Column(String(100), unique=True)
-    role = Column(Enum('commercial', 'management', 'support'))
+    role = Column(Enum(*ROLES, name="user_role"))
 
     # Relationships definition
-    clients = relationship("Client", back_populates="commercial_contact")
-    contracts = relationship("Contract", back_populates="commercial_contact")
-    events = relationship("Event", back_populates="support_contact")
+    # The database nulls the references of a deleted user (ON DELETE SET NULL), so the ORM
+    # does not need to load these collections to dissociate them
+    clients = relationship("Client", back_populates="commercial_contact", passive_deletes=True)
+    contracts = relationship("Contract", back_populates="commercial_contact", passive_deletes=True)
+    events = relationship("Event", back_populates="support_contact", passive_deletes=True)
 
     @classmethod
     def create(cls, db: Session, username: str, first_name: str, last_name: str, email: str, role: str,
@@ -51,8 +309,8 @@ class User(Base):
         Args:
             db (Session): SQLAlchemy database session.
             username (str): Unique username for authentication (max 100 characters).
-            first_name (str): User's first name (max 100 characters).
-            last_name (str): User's last name (max 100 characters).
+            first_name (str): User's first name (max 64 characters).
+            last_name (str): User's last name (max 64 characters).
             If already taken, a suffix will be added (e.g., "john_doe_1").
             email (str): Unique email address of the user.
             role (str): Role of the user (commercial/management/support).
@@ -61,20 +319,16 @@ class User(Base):
         Returns:
             User: The newly created User object.
         Raises:
-            ValueError: If username/email is taken, fields are empty, or role is invalid.
+            ValueError: If username/email is taken, fields are empty or too long, or role is invalid.
         """
 
-        # Check for duplicate username
-        if db.query(cls).filter_by(username=username).first():
-            raise ValueError(ErrorMessages.USERNAME_TAKEN.name)
-
-        # Check for duplicate email
-        if db.query(cls).filter_by(email=email).first():
-            raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
+        # Check for duplicate username or email in a single query
+        conflict = cls.get_identity_conflict(db, username, email)
+        if conflict:
+            raise ValueError(conflict)
 
         if role:
-            valid_roles = ["commercial", "management", "support"]
-            if role not in valid_roles:
+            if not (isinstance(role, str) and role in _VALID_ROLES):
                 raise ValueError(ErrorMessages.INVALID_ROLE.name)
 
         # Check for empty required fields
@@ -82,6 +336,10 @@ class User(Base):
         if not all(required_fields):
             raise ValueError(ErrorMessages.REQUIRED_FIELDS_EMPTY.name)
 
+        # Check that the text fields fit in their columns
+        if _too_long(cls, username=username, first_name=first_name, last_name=last_name, email=email):
+            raise ValueError(ErrorMessages.FIELD_TOO_LONG.name)
+
         return cls(
             username=username,
             first_name=first_name,
@@ -91,6 +349,32 @@ class User(Base):
             password_hash=password_hash
         )
 
+    @classmethod
+    def create_many(cls, db: Session, rows: list[dict]):
+        """
+        Inserts several users with a single executemany INSERT statement.
+        Apart from username/email uniqueness, which is checked upfront for the whole batch,
+        no per-row validation is performed, so this is meant for trusted seed/import data.
+        Does NOT commit (handled by the caller).
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            rows (list[dict]): Column values of each user, keyed by column name.
+
+        Raises:
+            ValueError: USERNAME_TAKEN or EMAIL_TAKEN if a value is repeated in the batch or already exists.
+        """
+        if not rows:
+            return
+
+        # Validate uniqueness with one query per unique column instead of one probe per row
+        if _has_duplicates(db, cls.username, (row.get("username") for row in rows)):
+            raise ValueError(ErrorMessages.USERNAME_TAKEN.name)
+        if _has_duplicates(db, cls.email, (row.get("email") for row in rows)):
+            raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
+
+        db.execute(insert(cls), rows)
+
     @classmethod
     def get_all(cls, db: Session):
         """
@@ -104,6 +388,36 @@ class User(Base):
         """
         return db.query(cls).all()
 
+    @classmethod
+    def get_id_list(cls, db: Session):
+        """
+        Retrieves the ID and username of every user, e.g. to let an operator pick one.
+
+        Only these two columns are selected, so no User objects are built.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+
+        Returns:
+            list[Row]: Rows exposing `user_id` and `username` attributes, ordered by ID.
+        """
+        return db.execute(select(cls.user_id, cls.username).order_by(cls.user_id)).all()
+
+    @classmethod
+    def iter_all(cls, db: Session, chunk_size: int = 1000):
+        """
+        Iterates over all users without loading the whole table in memory.
+        Rows are fetched from the database in chunks of `chunk_size`.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            chunk_size (int, optional): Number of rows fetched per round-trip. Defaults to 1000.
+
+        Returns:
+            Iterator[User]: User objects, streamed chunk by chunk.
+        """
+        return db.query(cls).yield_per(chunk_size)
+
     @classmethod
     def get_by_id(cls, db: Session, user_id: int):
         """
@@ -115,8 +429,12 @@ class User(Base):
 
         Returns:
             User: The User object if found, None otherwise.
+
+        Notes:
+            - Inside a request scope (see epic_events.request_cache), found users are
+              memoized so repeated lookups of the same ID issue a single SELECT.
         """
-        return db.query(cls).filter_by(user_id=user_id).first()
+        return _cached_get_by_id(db, cls, user_id)
 
     @classmethod
     def get_by_username(cls, db: Session, username: str):
@@ -130,7 +448,28 @@ class User(Base):
         Returns:
             User | None: The user if found, otherwise None.
         """
-        return db.query(cls).filter_by(username=username).first()
+        return db.execute(_USER_BY_USERNAME, {"username": username}).scalars().first()
+
+    @classmethod
+    def get_identity_conflict(cls, db: Session, username: str, email: str):
+        """
+        Tells whether a username or an email is already taken, with a single SELECT.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            username (str): Username to check.
+            email (str): Email to check.
+
+        Returns:
+            str | None: USERNAME_TAKEN (checked first) or EMAIL_TAKEN, or None if both are free.
+        """
+        with db.no_autoflush:
+            existing = db.execute(_USER_CONFLICTS, {"username": username, "email": email}).all()
+        if any(row.username == username for row in existing):
+            return ErrorMessages.USERNAME_TAKEN.name
+        if existing:
+            return ErrorMessages.EMAIL_TAKEN.name
+        return None
 
     def update(self, db: Session, username: str = None, first_name: str = None, last_name: str = None,
                email: str = None, role: str = None):
@@ -147,70 +486,73 @@ class User(Base):
             role (str, optional): New role.
 
         Raises:
-            ValueError: If the new email is already taken by another user.
+            ValueError: If the new username/email is already taken by another user,
+                        a field is too long, or the role is invalid.
         """
 
-        # Check for duplicate username (if provided and different from current)
-        if username is not None and username != self.username:
-            if db.query(User).filter(User.username == username, User.user_id != self.user_id).first():
+        # Keep only the provided fields whose value actually differs from the current one
+        requested = {
+            "username": username,
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "role": role,
+        }
+        changes = {field: value for field, value in requested.items() if value and value != getattr(self, field)}
+
+        # Check for duplicate username and/or email (only the ones that change) in a single query.
+        # An unchanged field is bound to NULL, which never matches.
+        if "username" in changes or "email" in changes:
+            with db.no_autoflush:
+                existing = db.execute(_USER_CONFLICTS_WITH_OTHERS, {
+                    "username": changes.get("username"),
+                    "email": changes.get("email"),
+                    "user_id": self.user_id,
+                }).all()
+            if "username" in changes and any(row.username == username for row in existing):
                 raise ValueError(ErrorMessages.USERNAME_TAKEN.name)
-
-        # Check for duplicate email (if provided and different from current)
-        if email is not None and email != self.email:
-            if db.query(User).filter(User.email == email, User.user_id != self.user_id).first():
+            if existing:
                 raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
 
         # Validate role if provided
         if role is not None:
-            valid_roles = ["commercial", "management", "support"]
-            if role not in valid_roles:
+            if not (isinstance(role, str) and role in _VALID_ROLES):
                 raise ValueError(ErrorMessages.INVALID_ROLE.name)
 
-        # Update fields
-        if username:
-            self.username = username
-        if first_name:
-            self.first_name = first_name
-        if last_name:
-            self.last_name = last_name
-        if email:
-            self.email = email
-        if role:
-            self.role = role
+        # Check that the changed text fields fit in their columns
+        if _too_long(User, **{field: value for field, value in changes.items() if field != "role"}):
+            raise ValueError(ErrorMessages.FIELD_TOO_LONG.name)
 
+        # Update changed fields
+        for field, value in changes.items():
+            setattr(self, field, value)
+
+        _evict_from_request_cache(db, User, self.user_id)
         return self
 
     def delete(self, db: Session):
         """
-        Deletes the user from the database after handling dependencies.
-        Dependencies automatically set no None.
+        Marks the user for deletion.
 
         Args:
             db (Session): SQLAlchemy database session.
 
         Notes:
-            - Clients: Sets their commercial_contact_id to None.
-            - Contracts: Sets their commercial_contact_id to None.
-            - Events: Sets their support_contact_id to None.
+            - Dependencies are dissociated by the database itself: the foreign keys of
+              clients and contracts (commercial_contact_id) and events (support_contact_id)
+              declare ON DELETE SET NULL, so no UPDATE is issued here and, thanks to
+              passive_deletes, no related row is loaded.
+            - Databases created before that constraint existed must be migrated once
+              (see the README), otherwise the DELETE is rejected by the foreign keys.
+            - Transaction boundaries (commit/rollback) are owned by the controller.
         """
-        try:
-            # Handle clients: set commercial_contact_id to None
-            for client in self.clients:
-                client.commercial_contact_id = None
-
-            # Handle contracts: set commercial_contact_id to None
-            for contract in self.contracts:
-                contract.commercial_contact_id = None
-
-            # Handle events: set support_contact_id to None
-            for event in self.events:
-                event.support_contact_id = None
-
+        # A user that was never persisted cannot be referenced by any row
+        if self.user_id is None:
             return self
 
-        except Exception:
-            db.rollback()
-            raise ValueError(ErrorMessages.DELETE_FAILED.name)
+        _evict_from_request_cache(db, User, self.user_id)
+        db.delete(self)
+        return self
 
 
 class Client(Base):
@@ -222,10 +564,10 @@ class Client(Base):
 
         Attributes:
             client_id (int): Primary key and unique identifier for the client.
-            first_name (str): Client's first name (max 100 characters).
-            last_name (str): Client's last name (max 100 characters).
+            first_name (str): Client's first name (max 64 characters).
+            last_name (str): Client's last name (max 64 characters).
             business_name (str): Name of the client's business (max 200 characters).
-            telephone (str): Client's phone number (max 100 characters).
+            telephone (str): Client's phone number (max 32 characters).
             email (str): Client's email address (unique, optional).
             first_contact (DateTime): Date and time of the first contact with the client.
             last_update (DateTime): Date and time of the last update for the client.
@@ -244,20 +586,26 @@ class Client(Base):
 
     # Columns definition
     client_id = Column(Integer, primary_key=True, index=True, nullable=False)
-    first_name = Column(String(100))
-    last_name = Column(String(100))
+    first_name = Column(String(64))
+    last_name = Column(String(64))
     business_name = Column(String(200))
-    telephone = Column(String(100))
+    telephone = Column(String(32))
     email = Column(String(100), unique=True)
     first_contact = Column(DateTime)
     last_update = Column(DateTime)
-    commercial_contact_id = Column(Integer, ForeignKey('users.user_id'), nullable=True)
+    commercial_contact_id = Column(Integer, ForeignKey('users.user_id', ondelete="SET NULL"), nullable=True,
+                                   index=True)
 
     # Relationship definition
     contracts = relationship("Contract", back_populates="client")
     commercial_contact = relationship("User", back_populates="clients")
     events = relationship("Event", back_populates="client")
 
+    # Fields that Client.update is allowed to modify (other keyword arguments are ignored)
+    _UPDATABLE_FIELDS = frozenset({
+        "first_name", "last_name", "business_name", "telephone", "email", "commercial_contact_id"
+    })
+
     @classmethod
     def create(cls, db: Session, first_name: str, last_name: str, email: str,
                commercial_contact_id: int, business_name: str = None,
@@ -279,21 +627,27 @@ class Client(Base):
             Client: The created Client object (not persisted).
 
         Raises:
-            ValueError: If validation fails (duplicate email, missing fields, invalid commercial contact).
+            ValueError: If validation fails (duplicate email, missing or too long fields).
+            A commercial_contact_id that does not exist is rejected by its foreign key on insert.
         """
         # Check for duplicate email
-        if db.query(cls).filter_by(email=email).first():
+        if _exists(db, _CLIENT_EMAIL_EXISTS, email=email):
             raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
 
         # Check for empty required fields
         if not all([first_name, last_name, email, commercial_contact_id]):
             raise ValueError(ErrorMessages.REQUIRED_FIELDS_EMPTY.name)
 
-        # Check if commercial_contact_id exists
-        if not db.query(User).filter_by(user_id=commercial_contact_id).first():
-            raise ValueError(ErrorMessages.CONTACT_NOT_FOUND.name)
+        # Check that the text fields fit in their columns
+        if _too_long(cls, first_name=first_name, last_name=last_name, email=email,
+                     business_name=business_name, telephone=telephone):
+            raise ValueError(ErrorMessages.FIELD_TOO_LONG.name)
+
+        # The existence of commercial_contact_id is enforced by its foreign key on insert
+        # (the controller maps the IntegrityError to CONTACT_NOT_FOUND)
 
         # Create and return the client object (not persisted)
+        now = datetime.now()
         return cls(
             first_name=first_name,
             last_name=last_name,
@@ -301,10 +655,34 @@ class Client(Base):
             commercial_contact_id=commercial_contact_id,
             business_name=business_name,
             telephone=telephone,
-            first_contact=datetime.now(),
-            last_update=datetime.now()
+            first_contact=now,
+            last_update=now
         )
 
+    @classmethod
+    def create_many(cls, db: Session, rows: list[dict]):
+        """
+        Inserts several clients with a single executemany INSERT statement.
+        Apart from email uniqueness, which is checked upfront for the whole batch,
+        no per-row validation is performed, so this is meant for trusted seed/import data.
+        Does NOT commit (handled by the caller).
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            rows (list[dict]): Column values of each client, keyed by column name.
+
+        Raises:
+            ValueError: EMAIL_TAKEN if an email is repeated in the batch or already exists.
+        """
+        if not rows:
+            return
+
+        # Validate email uniqueness with one query for the whole batch instead of one probe per row
+        if _has_duplicates(db, cls.email, (row.get("email") for row in rows)):
+            raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
+
+        db.execute(insert(cls), rows)
+
     def update(self, db: Session, **kwargs):
         """
         Updates the client's information with validation.
@@ -313,31 +691,44 @@ class Client(Base):
         Args:
             db (Session): SQLAlchemy session for validation.
             **kwargs: Fields to update (e.g., email="new@example.com", telephone="1234567890").
-                     Only provided fields are modified.
+                     Only provided fields listed in Client._UPDATABLE_FIELDS are modified.
 
         Returns:
             Client: Updated client object (not persisted).
 
         Raises:
-            ValueError: If email is already taken by another client.
+            ValueError: If email is already taken by another client, or a field is too long.
         """
-        # Validate email uniqueness if provided and different
-        if "email" in kwargs and kwargs["email"] != self.email:
-            if db.query(Client).filter(Client.email == kwargs["email"], Client.client_id != self.client_id).first():
-                raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
-
-        # Update fields (only provided ones)
+        # Keep only the provided fields whose value actually differs from the current one
+        changes = {}
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in Client._UPDATABLE_FIELDS:
                 # Handle empty strings for optional fields
                 if value == "" and key in ["business_name", "telephone"]:
-                    setattr(self, key, None)
-                else:
-                    setattr(self, key, value)
+                    value = None
+                # Surrounding whitespace does not make a different email
+                if key == "email" and isinstance(value, str):
+                    value = value.strip()
+                if value != getattr(self, key):
+                    changes[key] = value
+
+        # Check that the changed text fields fit in their columns
+        if _too_long(Client, **{key: value for key, value in changes.items() if key != "commercial_contact_id"}):
+            raise ValueError(ErrorMessages.FIELD_TOO_LONG.name)
+
+        # Validate email uniqueness (only if it changes)
+        if "email" in changes:
+            if _exists(db, _CLIENT_EMAIL_TAKEN_BY_OTHER, email=changes["email"], client_id=self.client_id):
+                raise ValueError(ErrorMessages.EMAIL_TAKEN.name)
+
+        # Update changed fields
+        for key, value in changes.items():
+            setattr(self, key, value)
 
         # Update last_update timestamp
         self.last_update = datetime.now()
 
+        _evict_from_request_cache(db, Client, self.client_id)
         return self
 
     @classmethod
@@ -350,8 +741,28 @@ class Client(Base):
 
         Returns:
             list[Client]: List of all Client objects.
+
+        Notes:
+            - The commercial contact displayed in the client list is loaded for all
+              clients with a single extra SELECT ... IN query, instead of one per client.
         """
-        return db.query(cls).all()
+        return db.query(cls).options(*_list_loading(cls.commercial_contact)).all()
+
+    @classmethod
+    def iter_all(cls, db: Session, chunk_size: int = 1000):
+        """
+        Iterates over all clients without loading the whole table in memory.
+        Rows are fetched from the database in chunks of `chunk_size`,
+        with their commercial contact eager-loaded for each chunk.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            chunk_size (int, optional): Number of rows fetched per round-trip. Defaults to 1000.
+
+        Returns:
+            Iterator[Client]: Client objects, streamed chunk by chunk.
+        """
+        return db.query(cls).options(*_list_loading(cls.commercial_contact)).yield_per(chunk_size)
 
     @classmethod
     def get_by_id(cls, db: Session, client_id: int):
@@ -367,7 +778,7 @@ class Client(Base):
 
         """
 
-        return db.query(cls).filter_by(client_id=client_id).first()
+        return _cached_get_by_id(db, cls, client_id)
 
 
 class Contract(Base):
@@ -400,8 +811,9 @@ class Contract(Base):
     rest_to_pay = Column(DECIMAL(10, 2))
     creation = Column(DateTime)
     signed = Column(Boolean, default=False)
-    client_id = Column(Integer, ForeignKey('clients.client_id'), nullable=True)
-    commercial_contact_id = Column(Integer, ForeignKey('users.user_id'), nullable=True)
+    client_id = Column(Integer, ForeignKey('clients.client_id'), nullable=True, index=True)
+    commercial_contact_id = Column(Integer, ForeignKey('users.user_id', ondelete="SET NULL"), nullable=True,
+                                   index=True)
 
     # Relationship definition
 
@@ -409,7 +821,7 @@ class Contract(Base):
     commercial_contact = relationship("User", back_populates="contracts")
 
     @classmethod
-    def create(cls, db: Session, total_price: float, rest_to_pay: float,
+    def create(cls, db: Session, total_price: Decimal, rest_to_pay: Decimal,
                client_id: int, commercial_contact_id: int, signed: bool = False):
         """
         Creates a new contract with full validation.
@@ -417,8 +829,9 @@ class Contract(Base):
 
         Args:
             db (Session): SQLAlchemy database session (for validation only).
-            total_price (float): Total amount of the contract (must be > 0).
-            rest_to_pay (float): Remaining amount to be paid (must be ≥ 0 and ≤ total_price).
+            total_price (Decimal | float): Total amount of the contract (must be > 0), rounded to the cent.
+            rest_to_pay (Decimal | float): Remaining amount to be paid (must be ≥ 0 and ≤ total_price),
+                rounded to the cent.
             client_id (int): ID of the associated client (must exist).
             commercial_contact_id (int): ID of the commercial user responsible (must exist).
             signed (bool, optional): Whether the contract is signed. Defaults to False.
@@ -428,13 +841,20 @@ class Contract(Base):
 
         Raises:
             ValueError: If validation fails:
+                        - INVALID_AMOUNT: total_price or rest_to_pay is not a finite number
                         - INVALID_TOTAL_PRICE: total_price ≤ 0
                         - INFERIOR_TOTAL_PRICE: rest_to_pay > total_price
                         - NEGATIVE_REST_TO_PAY: rest_to_pay < 0
-                        - CLIENT_NOT_FOUND: client_id does not exist
-                        - CONTACT_NOT_FOUND: commercial_contact_id does not exist
+                        - CLIENT_NOT_FOUND: client_id is missing
+                        - CONTACT_NOT_FOUND: commercial_contact_id is missing
+
+        Notes:
+            - A client_id or commercial_contact_id that does not exist is rejected by the
+              foreign key constraint when the controller persists the contract.
         """
-        # Validate total_price
+        # Normalize amounts to fixed-point once, then validate total_price
+        total_price = _to_amount(total_price)
+        rest_to_pay = _to_amount(rest_to_pay)
         if total_price <= 0:
             raise ValueError(ErrorMessages.INVALID_TOTAL_PRICE.name)
 
@@ -444,12 +864,11 @@ class Contract(Base):
         if rest_to_pay > total_price:
             raise ValueError(ErrorMessages.INFERIOR_TOTAL_PRICE.name)
 
-        # Check if client exists
-        if not db.query(Client).filter_by(client_id=client_id).first():
+        # Check that both references are provided; their existence is enforced by the
+        # foreign keys on insert (the controller maps the IntegrityError to the right error)
+        if client_id is None:
             raise ValueError(ErrorMessages.CLIENT_NOT_FOUND.name)
-
-        # Check if commercial contact exists
-        if not db.query(User).filter_by(user_id=commercial_contact_id).first():
+        if commercial_contact_id is None:
             raise ValueError(ErrorMessages.CONTACT_NOT_FOUND.name)
 
         # Create and return the contract object (not persisted)
@@ -462,7 +881,21 @@ class Contract(Base):
             signed=signed
         )
 
-    def update(self, db: Session, total_price: float = None, rest_to_pay: float = None,
+    @classmethod
+    def create_many(cls, db: Session, rows: list[dict]):
+        """
+        Inserts several contracts with a single executemany INSERT statement.
+        Rows are inserted as-is: no per-row validation is performed, so this is meant
+        for trusted seed/import data. Does NOT commit (handled by the caller).
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            rows (list[dict]): Column values of each contract, keyed by column name.
+        """
+        if rows:
+            db.execute(insert(cls), rows)
+
+    def update(self, db: Session, total_price: Decimal = None, rest_to_pay: Decimal = None,
                client_id: int = None, commercial_contact_id: int = None, signed: bool = None):
         """
         Updates the contract's information with validation.
@@ -470,8 +903,9 @@ class Contract(Base):
 
         Args:
             db (Session): SQLAlchemy database session (for validation only).
-            total_price (float, optional): New total price (must be > 0).
-            rest_to_pay (float, optional): New remaining amount (must be ≥ 0 and ≤ total_price).
+            total_price (Decimal | float, optional): New total price (must be > 0), rounded to the cent.
+            rest_to_pay (Decimal | float, optional): New remaining amount (must be ≥ 0 and ≤ total_price),
+                rounded to the cent.
             client_id (int, optional): New client ID (must exist).
             commercial_contact_id (int, optional): New commercial contact ID (must exist).
             signed (bool, optional): New signed status.
@@ -480,16 +914,18 @@ class Contract(Base):
             Contract: The updated Contract object (not persisted).
 
         Raises:
-            ValueError: If validations fail (invalid prices, IDs not found).
+            ValueError: If validations fail (invalid or non-finite prices, IDs not found).
         """
         # Update total_price if provided
         if total_price is not None:
+            total_price = _to_amount(total_price)
             if total_price <= 0:
                 raise ValueError(ErrorMessages.INVALID_TOTAL_PRICE.name)
             self.total_price = total_price
 
         # Update rest_to_pay if provided
         if rest_to_pay is not None:
+            rest_to_pay = _to_amount(rest_to_pay)
             current_total = self.total_price if total_price is None else total_price
             if rest_to_pay < 0:
                 raise ValueError(ErrorMessages.NEGATIVE_REST_TO_PAY.name)
@@ -497,22 +933,22 @@ class Contract(Base):
                 raise ValueError(ErrorMessages.INFERIOR_TOTAL_PRICE.name)
             self.rest_to_pay = rest_to_pay
 
-        # Update client_id if provided
-        if client_id is not None and client_id != self.client_id:
-            if not db.query(Client).filter_by(client_id=client_id).first():
-                raise ValueError(ErrorMessages.CLIENT_NOT_FOUND.name)
-            self.client_id = client_id
-
-        # Update commercial_contact_id if provided
-        if commercial_contact_id is not None and commercial_contact_id != self.commercial_contact_id:
-            if not db.query(User).filter_by(user_id=commercial_contact_id).first():
-                raise ValueError(ErrorMessages.CONTACT_NOT_FOUND.name)
-            self.commercial_contact_id = commercial_contact_id
+        # Update client_id and commercial_contact_id if provided (the changed ones are checked in a single query)
+        new_client_id = client_id if client_id != self.client_id else None
+        new_contact_id = commercial_contact_id if commercial_contact_id != self.commercial_contact_id else None
+        error = _missing_reference(db, client_id=new_client_id, user_id=new_contact_id)
+        if error:
+            raise ValueError(error)
+        if new_client_id is not None:
+            self.client_id = new_client_id
+        if new_contact_id is not None:
+            self.commercial_contact_id = new_contact_id
 
         # Update signed status if provided
         if signed is not None:
             self.signed = signed
 
+        _evict_from_request_cache(db, Contract, self.contract_id)
         return self
 
     @classmethod
@@ -525,24 +961,48 @@ class Contract(Base):
 
         Returns:
             list[Contract]: List of all Contract objects.
+
+        Notes:
+            - The client and commercial contact displayed in the contract list are loaded
+              for all contracts with one extra SELECT ... IN query each, instead of one per contract.
         """
-        return db.query(cls).all()
+        return db.query(cls).options(*_list_loading(cls.client, cls.commercial_contact)).all()
+
+    @classmethod
+    def iter_all(cls, db: Session, chunk_size: int = 1000):
+        """
+        Iterates over all contracts without loading the whole table in memory.
+        Rows are fetched from the database in chunks of `chunk_size`,
+        with their client and commercial contact eager-loaded for each chunk.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            chunk_size (int, optional): Number of rows fetched per round-trip. Defaults to 1000.
+
+        Returns:
+            Iterator[Contract]: Contract objects, streamed chunk by chunk.
+        """
+        return db.query(cls).options(*_list_loading(cls.client, cls.commercial_contact)).yield_per(chunk_size)
 
     @classmethod
-    def get_by_id(cls, db: Session, contract_id: int):
+    def get_by_id(cls, db: Session, contract_id: int, with_related: bool = False):
         """
             Retrieves a contract by their ID.
 
             Args:
             db (Session): SQLAlchemy database session.
             contract_id (int): The ID of the contract to retrieve.
+            with_related (bool): Also load the client and the commercial contact in the
+                same SELECT (used by the update flow, which displays both).
 
             Returns:
             Contract: The Contract object if found, None otherwise.
 
         """
-
-        return db.query(cls).filter_by(contract_id=contract_id).first()
+        if with_related:
+            return _cached_get_by_id(db, cls, contract_id,
+                                     (joinedload(cls.client), joinedload(cls.commercial_contact)))
+        return _cached_get_by_id(db, cls, contract_id)
 
     @classmethod
     def get_pending_contracts(cls, db: Session):
@@ -555,7 +1015,7 @@ class Contract(Base):
         Returns:
             List[Contract]: List of contracts matching the criteria.
         """
-        return db.query(cls).filter(
+        return db.query(cls).options(*_list_loading(cls.client, cls.commercial_contact)).filter(
             or_(cls.signed == False, cls.rest_to_pay > 0)
         ).all()
 
@@ -592,8 +1052,8 @@ class Event(Base):
     end_datetime = Column(DateTime, nullable=False)
     location = Column(String(200))
     attendees = Column(Integer)
-    client_id = Column(Integer, ForeignKey('clients.client_id'), nullable=True)
-    support_contact_id = Column(Integer, ForeignKey('users.user_id'), nullable=True)
+    client_id = Column(Integer, ForeignKey('clients.client_id'), nullable=True, index=True)
+    support_contact_id = Column(Integer, ForeignKey('users.user_id', ondelete="SET NULL"), nullable=True, index=True)
 
     # Relationships definition
     client = relationship("Client", back_populates="events")
@@ -628,16 +1088,19 @@ class Event(Base):
                         - END_BEFORE_START: end_datetime is before start_datetime
         """
         # Check if client exists
-        if not db.query(Client).filter_by(client_id=client_id).first():
+        if not _is_loaded(db, Client, client_id) and not _exists(db, _CLIENT_EXISTS, client_id=client_id):
             raise ValueError(ErrorMessages.CLIENT_NOT_FOUND.name)
 
         # Check if contract exists and is signed
-        contract = db.query(Contract).filter_by(client_id=client_id).first()
+        with db.no_autoflush:
+            contract = db.execute(_CONTRACT_BY_CLIENT, {"client_id": client_id}).scalars().first()
         if not contract or not contract.signed:
             raise ValueError(ErrorMessages.CONTRACT_NOT_SIGNED.name)
 
-        # Validate dates
-        if start_datetime < datetime.now():
+        # Validate dates (timezone-aware inputs are stored as naive local time)
+        start_datetime = _to_local_naive(start_datetime)
+        end_datetime = _to_local_naive(end_datetime)
+        if _is_in_past(start_datetime):
             raise ValueError(ErrorMessages.EVENT_DATE_IN_PAST.name)
         if end_datetime < start_datetime:
             raise ValueError(ErrorMessages.END_BEFORE_START.name)
@@ -653,6 +1116,20 @@ class Event(Base):
             client_id=client_id
         )
 
+    @classmethod
+    def create_many(cls, db: Session, rows: list[dict]):
+        """
+        Inserts several events with a single executemany INSERT statement.
+        Rows are inserted as-is: no per-row validation is performed, so this is meant
+        for trusted seed/import data. Does NOT commit (handled by the caller).
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            rows (list[dict]): Column values of each event, keyed by column name.
+        """
+        if rows:
+            db.execute(insert(cls), rows)
+
     @classmethod
     def get_all(cls, db: Session):
         """
@@ -663,8 +1140,28 @@ class Event(Base):
 
         Returns:
             list[Event]: List of all Events objects.
+
+        Notes:
+            - The client and support contact displayed in the event list are loaded
+              for all events with one extra SELECT ... IN query each, instead of one per event.
         """
-        return db.query(cls).all()
+        return db.query(cls).options(*_list_loading(cls.client, cls.support_contact)).all()
+
+    @classmethod
+    def iter_all(cls, db: Session, chunk_size: int = 1000):
+        """
+        Iterates over all events without loading the whole table in memory.
+        Rows are fetched from the database in chunks of `chunk_size`,
+        with their client and support contact eager-loaded for each chunk.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            chunk_size (int, optional): Number of rows fetched per round-trip. Defaults to 1000.
+
+        Returns:
+            Iterator[Event]: Event objects, streamed chunk by chunk.
+        """
+        return db.query(cls).options(*_list_loading(cls.client, cls.support_contact)).yield_per(chunk_size)
 
     @classmethod
     def get_by_id(cls, db: Session, event_id: int):
@@ -680,7 +1177,7 @@ class Event(Base):
 
         """
 
-        return db.query(cls).filter_by(event_id=event_id).first()
+        return _cached_get_by_id(db, cls, event_id)
 
     @classmethod
     def get_unassigned_events(cls, db: Session):
@@ -693,7 +1190,9 @@ class Event(Base):
         Returns:
             List[Event]: List of Event objects without a support contact.
         """
-        return db.query(cls).filter(cls.support_contact_id.is_(None)).all()
+        return db.query(cls).options(
+            *_list_loading(cls.client, cls.support_contact)
+        ).filter(cls.support_contact_id.is_(None)).all()
 
     @classmethod
     def get_assigned_to_user(cls, db: Session, user_id: int):
@@ -707,7 +1206,9 @@ class Event(Base):
         Returns:
             List[Event]: List of events assigned to the user.
         """
-        return db.query(cls).filter(cls.support_contact_id == user_id).all()
+        return db.query(cls).options(
+            *_list_loading(cls.client, cls.support_contact)
+        ).filter(cls.support_contact_id == user_id).all()
 
     def update(self, db: Session, name: str = None, notes: str = None,
                start_datetime: datetime = None, end_datetime: datetime = None,
@@ -754,9 +1255,13 @@ class Event(Base):
         if attendees is not None:
             self.attendees = attendees
 
+        # Timezone-aware inputs are compared and stored as naive local time
+        start_datetime = _to_local_naive(start_datetime)
+        end_datetime = _to_local_naive(end_datetime)
+
         # Update start_datetime if provided
         if start_datetime is not None:
-            if start_datetime < datetime.now():
+            if _is_in_past(start_datetime):
                 raise ValueError(ErrorMessages.EVENT_DATE_IN_PAST.name)
             self.start_datetime = start_datetime
 
@@ -767,16 +1272,35 @@ class Event(Base):
                 raise ValueError(ErrorMessages.END_BEFORE_START.name)
             self.end_datetime = end_datetime
 
-        # Update client_id if provided
-        if client_id is not None and client_id != self.client_id:
-            if not db.query(Client).filter_by(client_id=client_id).first():
-                raise ValueError(ErrorMessages.CLIENT_NOT_FOUND.name)
-            self.client_id = client_id
+        # Update client_id and support_contact_id if provided (the changed ones are checked in a single query)
+        new_client_id = client_id if client_id != self.client_id else None
+        new_support_id = support_contact_id if support_contact_id != self.support_contact_id else None
+        error = _missing_reference(db, client_id=new_client_id, user_id=new_support_id)
+        if error:
+            raise ValueError(error)
+        if new_client_id is not None:
+            self.client_id = new_client_id
+        if new_support_id is not None:
+            self.support_contact_id = new_support_id
+
+        _evict_from_request_cache(db, Event, self.event_id)
+        return self
 
-        # Update support_contact_id if provided
-        if support_contact_id is not None and support_contact_id != self.support_contact_id:
-            if not db.query(User).filter_by(user_id=support_contact_id).first():
-                raise ValueError(ErrorMessages.CONTACT_NOT_FOUND.name)
-            self.support_contact_id = support_contact_id
 
-        return self
+# Validation statements, built once at import time and executed with bound parameters,
+# so the hot create/update paths do not rebuild the same SELECT on every call.
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username")).limit(1)
+_USER_CONFLICTS = select(User.username, User.email).where(
+    or_(User.username == bindparam("username"), User.email == bindparam("email"))
+)
+_USER_CONFLICTS_WITH_OTHERS = _USER_CONFLICTS.where(User.user_id != bindparam("user_id"))
+_CLIENT_EXISTS = select(exists().where(Client.client_id == bindparam("client_id")))
+_CLIENT_EMAIL_EXISTS = select(exists().where(Client.email == bindparam("email")))
+_CLIENT_EMAIL_TAKEN_BY_OTHER = select(exists().where(
+    Client.email == bindparam("email"), Client.client_id != bindparam("client_id")
+))
+_CLIENT_AND_USER_EXIST = select(
+    exists().where(Client.client_id == bindparam("client_id")).label("client_exists"),
+    exists().where(User.user_id == bindparam("user_id")).label("user_exists")
+)
+_CONTRACT_BY_CLIENT = select(Contract).where(Contract.client_id == bindparam("client_id")).limit(1)
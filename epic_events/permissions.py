@@ -1,62 +1,38 @@
+from __future__ import annotations
+
+import inspect
+import weakref
 from functools import wraps
 from epic_events.auth import SessionContext
 from epic_events.views import DisplayMessages
 
+_ACCESS_DENIED = "ACCESS_DENIED"
 
-def requires_authentication(func):
-    """
-        Decorator that enforces user authentication before executing a controller action.
-
-        This decorator ensures that a valid and authenticated SessionContext
-        is provided to the decorated function. It expects the `session` argument
-        to be passed as a keyword argument.
-
-        If the session is missing or not authenticated:
-            - Access denied error message is displayed
-            - The decorated function is NOT executed
-            - None is returned
-
-        Typical usage:
-            @requires_authentication
-            def some_controller_action(db, session):
-                ...
-
-        Args:
-            func (callable): The controller function to protect.
 
-        Returns:
-            callable: A wrapped function that performs an authentication check
-            before delegating execution to the original function.
+def _deny():
     """
+    Displays the access denied error and returns None, the result of a denied call.
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-
-        session = kwargs.get("session")
-
-        if session is None and len(args) >= 2:
-            session = args[1]
-
-        if not session or not session.is_valid():
-            DisplayMessages.display_error("ACCESS_DENIED")
-            return None
-
-        return func(*args, **kwargs)
-
-    return wrapper
+    DisplayMessages.display_error is looked up at call time (not bound at import)
+    so that it can still be replaced, e.g. by tests.
+    """
+    DisplayMessages.display_error(_ACCESS_DENIED)
+    return None
 
 
-def commercial_only(func):
+def _role_guard(*roles):
     """
-    Decorator that restricts access to authenticated users with the 'commercial' role.
+    Builds a decorator that enforces authentication (and optionally a role)
+    before executing a controller action.
 
-    This decorator ensures that:
-        - A SessionContext is provided
-        - The user is authenticated
-        - The user's role is 'commercial'
+    The returned decorator ensures that:
+        - A SessionContext is provided (as the `session` keyword argument
+          or as the second positional argument)
+        - The session is valid (authenticated and not expired)
+        - The user's role is one of `roles` (any role if none is given)
 
-    The decorated function expects the `session` argument to be passed
-    as a keyword argument.
+    The last session approved by a guard is remembered together with its auth_epoch:
+    while it stays unchanged, later calls only re-check its expiry.
 
     If any of these conditions fail:
         - Access denied error message is displayed
@@ -64,133 +40,131 @@ def commercial_only(func):
         - None is returned
 
     Typical usage:
+        commercial_only = _role_guard("commercial")
+
         @commercial_only
         def create_client(db, session):
             ...
 
     Args:
-        func (callable): The controller function to protect.
+        *roles (str): Roles allowed to run the decorated function.
 
     Returns:
-        callable: A wrapped function that enforces commercial-only access.
+        callable: A decorator wrapping controller functions with the access check.
     """
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        session: SessionContext = kwargs.get("session")
+    role_allowed = _role_check(roles)
 
-        if session is None and len(args) >= 2:
-            session = args[1]
+    # Last session approved by this guard (weak reference) and its auth_epoch at that time
+    last_approved = [None, None]
 
-        if (
-                not session
-                or not session.is_valid()
-                or session.role != "commercial"
-        ):
-            DisplayMessages.display_error("ACCESS_DENIED")
-            return None
+    def is_allowed(session: SessionContext):
+        if not session:
+            return False
 
-        return func(*args, **kwargs)
+        reference, epoch = last_approved
+        if reference is not None and reference() is session and session.auth_epoch == epoch:
+            # Same session, role and authentication unchanged since approval: only expiry is left to check
+            if not session.is_expired():
+                return True
+            session.end_session()
+            return False
 
-    return wrapper
+        if session.is_valid() and role_allowed(session.role):
+            last_approved[:] = [weakref.ref(session), session.auth_epoch]
+            return True
+        return False
 
+    def decorator(func):
+        index = _session_index(func)
 
-def management_only(func):
-    """
-    Decorator that restricts access to authenticated users with the 'management' role.
+        if index is None:
+            # `session` is keyword-only
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not is_allowed(kwargs.get("session")):
+                    return _deny()
 
-    This decorator ensures that:
-        - A SessionContext is provided
-        - The user is authenticated
-        - The user's role is 'management'
+                return func(*args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if "session" in kwargs:
+                    session = kwargs["session"]
+                else:
+                    session = args[index] if len(args) > index else None
 
-    The decorated function expects the `session` argument to be passed
-    as a keyword argument.
+                if not is_allowed(session):
+                    return _deny()
 
-    If the user is not authenticated or does not have the required role:
-        - Access denied error message is displayed
-        - The decorated function is NOT executed
-        - None is returned.
+                return func(*args, **kwargs)
 
-    Typical usage:
-        @management_only
-        def create_user(db, session):
-            ...
+        return wrapper
 
-    Args:
-        func (callable): The controller function to protect.
+    return decorator
 
-    Returns:
-        callable: A wrapped function that enforces management-only access.
+
+def _role_check(roles):
     """
+    Builds, once at decoration time, the role test used by a guard.
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        session: SessionContext = kwargs.get("session")
+    Args:
+        roles (Iterable[str]): Allowed roles (any role if empty).
 
-        if session is None and len(args) >= 2:
-            session = args[1]
+    Returns:
+        callable: A function taking a role and returning True if it is allowed.
+        The roles are frozen into a frozenset (O(1) membership), and the common
+        single-role case is specialized into a plain equality check.
+    """
+    allowed_roles = frozenset(roles)
 
-        if (
-                not session
-                or not session.is_valid()
-                or session.role != "management"
-        ):
-            DisplayMessages.display_error("ACCESS_DENIED")
-            return None
+    if not allowed_roles:
+        def role_allowed(role):
+            return True
+    elif len(allowed_roles) == 1:
+        (only_role,) = allowed_roles
 
-        return func(*args, **kwargs)
+        def role_allowed(role):
+            return role == only_role
+    else:
+        role_allowed = allowed_roles.__contains__
 
-    return wrapper
+    return role_allowed
 
 
-def support_only(func):
+def _session_index(func):
     """
-    Decorator that restricts access to authenticated users with the 'support' role.
-
-    This decorator ensures that:
-        - A SessionContext is provided
-        - The user is authenticated
-        - The user's role is 'support'
-
-    The decorated function expects the `session` argument to be passed
-    as a keyword argument.
-
-    If the user is not authenticated or does not have the required role:
-        - Access denied error message is displayed
-        - The decorated function is NOT executed
-        - None is returned.
-
-    Typical usage:
-        @support_only
-        def update_event(db, session):
-            ...
+    Finds, once at decoration time, where the decorated function receives its session.
 
     Args:
         func (callable): The controller function to protect.
 
     Returns:
-        callable: A wrapped function that enforces support-only access.
+        int | None: Positional index of the `session` parameter, or None if it is keyword-only.
+        Functions without a named `session` parameter (e.g. `*args, **kwargs`) follow the
+        controller convention `(db, session, ...)` and get index 1.
     """
+    parameters = inspect.signature(func).parameters
+    session_parameter = parameters.get("session")
+
+    if session_parameter is None:
+        return 1
+    if session_parameter.kind == inspect.Parameter.KEYWORD_ONLY:
+        return None
+    return list(parameters).index("session")
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        session: SessionContext = kwargs.get("session")
 
-        if session is None and len(args) >= 2:
-            session = args[1]
+# Any authenticated user with a valid session.
+requires_authentication = _role_guard()
 
-        if (
-                not session
-                or not session.is_valid()
-                or session.role != "support"
-        ):
-            DisplayMessages.display_error("ACCESS_DENIED")
-            return None
+# Authenticated users with the 'commercial' role (e.g. create_client).
+commercial_only = _role_guard("commercial")
 
-        return func(*args, **kwargs)
+# Authenticated users with the 'management' role (e.g. create_user).
+management_only = _role_guard("management")
 
-    return wrapper
+# Authenticated users with the 'support' role (e.g. update_event).
+support_only = _role_guard("support")
 
 
 def role_permission(allowed_roles):
@@ -198,21 +172,4 @@ def role_permission(allowed_roles):
     Decorator to restrict access to users with specific roles.
     Works like `support_only` but supports multiple allowed roles.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            session = kwargs.get("session")
-            if session is None and len(args) >= 2:
-                session = args[1]
-
-            if not session or not session.is_valid():
-                DisplayMessages.display_error("ACCESS_DENIED")
-                return None
-
-            if session.role not in allowed_roles:
-                DisplayMessages.display_error("ACCESS_DENIED")
-                return None
-
-            return func(*args, **kwargs)
-        return wrapper
-    return decorator
+    return _role_guard(*allowed_roles)
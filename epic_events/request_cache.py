@@ -0,0 +1,82 @@
+"""
+Request-scoped cache for database lookups.
+
+In this CLI a "request" is one menu action (create a client, update an event, ...).
+Lookups that are repeated while serving the same action (e.g. resolving the same
+user several times) can be answered from a dictionary that lives only for the
+duration of that action, instead of issuing the same SELECT again.
+
+Outside of a request scope no cache is active and lookups always hit the database.
+The cache is bounded: once it holds REQUEST_CACHE_SIZE entries, the least recently
+used one is dropped, so a long-running action cannot grow it without limit.
+Entries are keyed by session (see models._cached_get_by_id). When a session commits or
+rolls back, its own entries are dropped, so that no cached row outlives the transaction
+it was read in (e.g. a row created then rolled back); other sessions keep theirs.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+REQUEST_CACHE_SIZE = 128
+
+_current_cache: ContextVar = ContextVar("request_cache", default=None)
+
+
+class _LRUCache(OrderedDict):
+    """Dictionary keeping at most `maxsize` entries, evicting the least recently used one."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+@contextmanager
+def request_scope():
+    """
+    Opens a fresh, empty cache for the duration of one request.
+
+    Typical usage:
+        with request_scope():
+            UserController.update_user(db, session)
+    """
+    token = _current_cache.set(_LRUCache(REQUEST_CACHE_SIZE))
+    try:
+        yield
+    finally:
+        _current_cache.reset(token)
+
+
+def get_request_cache():
+    """
+    Returns the cache of the active request.
+
+    Returns:
+        dict | None: The (LRU-bounded) cache dictionary, or None when no request scope is active.
+    """
+    return _current_cache.get()
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _evict_session_entries(session):
+    """Drops the entries of a session from the active request cache when it ends its transaction."""
+    cache = _current_cache.get()
+    if cache:
+        session_id = id(session)
+        for key in [key for key in cache if key[0] == session_id]:
+            del cache[key]
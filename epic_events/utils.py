@@ -1,6 +1,9 @@
 from enum import Enum
 import click
 
+# User roles, shared by the users.role column, the role validation and the role prompts
+ROLES = ("commercial", "management", "support")
+
 
 class ErrorMessages(Enum):
     """
@@ -10,6 +13,7 @@ class ErrorMessages(Enum):
     USERNAME_TAKEN = "This username is already taken."
     EMAIL_TAKEN = "This email is already registered."
     REQUIRED_FIELDS_EMPTY = "Required fields cannot be empty or whitespace."
+    FIELD_TOO_LONG = "One or more fields exceed their maximum length."
     INVALID_ROLE = "Invalid role. Must be one of: commercial, management, support."
     DELETE_FAILED = "Failed to delete user. Dependencies may be locked."
     DATABASE_ERROR = "A technical error occurred. Please try again later."
@@ -17,6 +21,7 @@ class ErrorMessages(Enum):
     INFERIOR_TOTAL_PRICE = "Total price can't be inferior to rest to pay."
     INVALID_TOTAL_PRICE = "Total_price can't be <= 0."
     NEGATIVE_REST_TO_PAY = "Rest to pay can't be < 0."
+    INVALID_AMOUNT = "Amounts must be finite numbers."
     CLIENT_NOT_FOUND = "The specified client does not exist."
     CONTRACT_NOT_FOUND = "The specified contract does not exist."
     CONTRACT_NOT_SIGNED = "You can't create an event if the client haven't signed the contract."
@@ -38,23 +43,31 @@ class ErrorMessages(Enum):
                     str: The error message associated with the provided key.
                          If the key is not found, returns the generic database error message.
         """
-        try:
-            return cls[error_key].value
-        except KeyError:
-            return cls.DATABASE_ERROR.value
+        return _MESSAGES.get(error_key, _DEFAULT_MESSAGE)
+
 
+# Plain dict view of ErrorMessages, built once so lookups skip the Enum metaclass
+_MESSAGES: dict[str, str] = {member.name: member.value for member in ErrorMessages}
+_DEFAULT_MESSAGE = ErrorMessages.DATABASE_ERROR.value
 
-def validate_length(prompt_text, max_length):
+
+def validate_length(prompt_text, max_length, values=None):
     """
     Helper function to validate the length of user input.
     Args:
         prompt_text (str): The prompt to display.
         max_length (int): Maximum allowed length.
+        values (Iterable[str], optional): Pre-supplied inputs (e.g. scripted or piped imports).
+            When given, no prompt is shown and the first value within max_length is returned.
     Returns:
-        str: Validated user input.
+        str: Validated user input (None if no pre-supplied value is valid).
     """
+    if values is not None:
+        return next((value for value in values if len(value) <= max_length), None)
+
+    error_message = f"Error: Input must be {max_length} characters or less. Try again."
     while True:
         value = click.prompt(prompt_text)
         if len(value) <= max_length:
             return value
-        print(f"Error: Input must be {max_length} characters or less. Try again.")
+        print(error_message)
@@ -1,9 +1,57 @@
-from epic_events.models import User, Client, Contract, Event
-from epic_events.utils import ErrorMessages, validate_length
+from epic_events.utils import ErrorMessages, ROLES, validate_length
 from datetime import datetime
 import click
 
 
+# Prompt types and formats built once at import instead of on every prompt
+_ROLE_CHOICE = click.Choice(ROLES, case_sensitive=False)
+_ROLE_CHOICE_STRICT = click.Choice(ROLES)
+_DT_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def _format_datetime(value):
+    """
+    Formats a datetime as "YYYY-MM-DD HH:MM" for display, or "N/A" when missing.
+
+    isoformat(" ", "minutes") produces the same text as strftime(_DT_FORMAT) at about half
+    the cost; the slice drops the UTC offset of timezone-aware values.
+    """
+    if value is None:
+        return "N/A"
+    return value.isoformat(" ", "minutes")[:16]
+
+
+def _full_name(person, missing="N/A"):
+    """Returns "first_name last_name" of a user or client, or `missing` when there is none."""
+    if person is None:
+        return missing
+    return f"{person.first_name} {person.last_name}"
+
+
+def _parse_datetime(text):
+    """
+    Parses a "YYYY-MM-DD HH:MM" date typed by the user.
+
+    Well-formed input goes through datetime.fromisoformat, which is much cheaper than
+    strptime; anything else (e.g. unpadded fields) falls back to strptime with _DT_FORMAT,
+    so the accepted inputs are unchanged.
+
+    Raises:
+        ValueError: If the text does not match the expected format.
+    """
+    if len(text) == 16 and text[4] == text[7] == "-" and text[10] == " " and text[13] == ":":
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, _DT_FORMAT)
+
+
+# Error lines fully formatted once at import: displaying an error is a single dict lookup
+_ERROR_LINES = {member.name: f"❌ Error: {member.value}\n" for member in ErrorMessages}
+_DEFAULT_ERROR_LINE = _ERROR_LINES[ErrorMessages.DATABASE_ERROR.name]
+
+
 class DisplayMessages:
     @staticmethod
     def display_success(message):
@@ -13,7 +61,7 @@ class DisplayMessages:
     @staticmethod
     def display_error(message_key):
         """Displays error message using our ErrorMessages class."""
-        click.echo(f"❌ Error: {ErrorMessages.get_message(message_key)}")
+        click.echo(_ERROR_LINES.get(message_key, _DEFAULT_ERROR_LINE), nl=False)
 
     @staticmethod
     def display_invalid_choice(menu_name):
@@ -26,77 +74,75 @@ class DisplayMessages:
         print("Exiting CRM. Goodbye!")
 
 
+def _menu(title, *options):
+    """Joins a menu title and its options into a single block, printed with one call."""
+    return "\n".join((f"\n=== {title} ===",) + options)
+
+
+# Menus are pre-joined once at import, with one variant per role when the options depend on it
+_MAIN_MENU = _menu("CRM Main Menu", "2. Manage Clients", "3. Manage Contracts", "4. Manage Events", "5. Quit")
+_MAIN_MENUS = {
+    "management": _menu("CRM Main Menu", "1. Manage Users", "2. Manage Clients", "3. Manage Contracts",
+                        "4. Manage Events", "5. Quit"),
+}
+
+_USERS_MENU = _menu("Users Menu", "1. Create User", "2. Update User", "3. Delete User", "4. Back to Main Menu")
+
+_CLIENTS_MENU = _menu("Clients Menu", "1. List Clients", "4. Back to Main Menu")
+_CLIENTS_MENUS = {
+    "commercial": _menu("Clients Menu", "1. List Clients", "2. Create Client", "3. Update Client",
+                        "4. Back to Main Menu"),
+}
+
+_CONTRACTS_MENU = _menu("Contracts Menu", "1. List Contracts", "5. Back to Main Menu")
+_CONTRACTS_MENUS = {
+    "management": _menu("Contracts Menu", "1. List Contracts", "2. Create Contract", "3. Update Contract",
+                        "5. Back to Main Menu"),
+    "commercial": _menu("Contracts Menu", "1. List Contracts", "3. Update Contract", "4. List Pending Contracts",
+                        "5. Back to Main Menu"),
+}
+
+_EVENTS_MENU = _menu("Events Menu", "1. List Events", "7. Back to Main Menu")
+_EVENTS_MENUS = {
+    "commercial": _menu("Events Menu", "1. List Events", "2. Create Event", "7. Back to Main Menu"),
+    "support": _menu("Events Menu", "1. List Events", "3. Update Event", "4. List My Assigned Events",
+                     "7. Back to Main Menu"),
+    "management": _menu("Events Menu", "1. List Events", "5. List Unassigned Events", "6. Assign Support to Event",
+                        "7. Back to Main Menu"),
+}
+
+
 class MenuView:
     """Static methods for displaying menus and capturing user choices."""
 
     @staticmethod
     def display_main_menu(session):
         """Displays the main menu and captures user choice."""
-        print("\n=== CRM Main Menu ===")
-        if session.role == "management":
-            print("1. Manage Users")
-        print("2. Manage Clients")
-        print("3. Manage Contracts")
-        print("4. Manage Events")
-        print("5. Quit")
+        print(_MAIN_MENUS.get(session.role, _MAIN_MENU))
         return input("Enter your choice (1-5): ")
 
     @staticmethod
     def display_users_menu():
         """Displays the Users submenu and captures user choice."""
-        print("\n=== Users Menu ===")
-        print("1. Create User")
-        print("2. Update User")
-        print("3. Delete User")
-        print("4. Back to Main Menu")
+        print(_USERS_MENU)
         return input("Enter your choice (1-4): ")
 
     @staticmethod
     def display_clients_menu(session):
         """Displays the Clients submenu and captures user choice."""
-        print("\n=== Clients Menu ===")
-        print("1. List Clients")
-        if session.role == "commercial":
-            print("2. Create Client")
-            print("3. Update Client")
-        print("4. Back to Main Menu")
+        print(_CLIENTS_MENUS.get(session.role, _CLIENTS_MENU))
         return input("Enter your choice (1-4): ")
 
     @staticmethod
     def display_contracts_menu(session):
         """Displays the Contracts submenu and captures user choice."""
-        print("\n=== Contracts Menu ===")
-        print("1. List Contracts")
-
-        if session.role == "management":
-            print("2. Create Contract")
-
-        if session.role in ("management", "commercial"):
-            print("3. Update Contract")
-
-        if session.role == "commercial":
-            print("4. List Pending Contracts")
-
-        print("5. Back to Main Menu")
+        print(_CONTRACTS_MENUS.get(session.role, _CONTRACTS_MENU))
         return input("Enter your choice (1-5): ")
 
     @staticmethod
     def display_events_menu(session):
         """Displays the Events submenu and captures user choice."""
-        print("\n=== Events Menu ===")
-        print("1. List Events")
-        if session.role == "commercial":
-            print("2. Create Event")
-
-        if session.role == "support":
-            print("3. Update Event")
-            print("4. List My Assigned Events")
-
-        if session.role == "management":
-            print("5. List Unassigned Events")
-            print("6. Assign Support to Event")
-
-        print("7. Back to Main Menu")
+        print(_EVENTS_MENUS.get(session.role, _EVENTS_MENU))
         return input("Enter your choice (1-7): ")
 
     @staticmethod
@@ -155,11 +201,9 @@ class UserView:
 
     @staticmethod
     def display_user_id_list(users):
-        print("\nAvailable users:")
-        print("ID | Username")
-        print("----------")
-        for user in users:
-            print(f"{user.user_id} | {user.username}")
+        lines = ["\nAvailable users:", "ID | Username", "----------"]
+        lines.extend(f"{user.user_id} | {user.username}" for user in users)
+        print("\n".join(lines))
 
     @staticmethod
     def prompt_user_creation():
@@ -170,12 +214,12 @@ class UserView:
             dict: User details (username, first_name, last_name, email, role).
         """
         username = validate_length("Username (max 100 chars)", 100)
-        first_name = validate_length("First name (max 100 chars)", 100)
-        last_name = validate_length("Last name (max 100 chars)", 100)
+        first_name = validate_length("First name (max 64 chars)", 64)
+        last_name = validate_length("Last name (max 64 chars)", 64)
         email = click.prompt("Email")
         role = click.prompt(
             "Role",
-            type=click.Choice(["commercial", "management", "support"], case_sensitive=False)
+            type=_ROLE_CHOICE
         )
         password = click.prompt("Password")
         return {
@@ -200,30 +244,19 @@ class UserView:
         click.echo(f"Updating user: {user.first_name} {user.last_name} (ID: {user.user_id})")
 
         # Prompt for each field with current value as default
-        username = click.prompt("New username", default=user.username)
-        first_name = click.prompt("New first name", default=user.first_name)
-        last_name = click.prompt("New last name", default=user.last_name)
-        email = click.prompt("New email", default=user.email)
-        role = click.prompt(
-            "New role",
-            type=click.Choice(["commercial", "management", "support"]),
-            default=user.role
-        )
+        updated_data = {
+            "username": click.prompt("New username", default=user.username),
+            "first_name": click.prompt("New first name", default=user.first_name),
+            "last_name": click.prompt("New last name", default=user.last_name),
+            "email": click.prompt("New email", default=user.email),
+            "role": click.prompt("New role", type=_ROLE_CHOICE_STRICT, default=user.role)
+        }
 
         # Return only fields that were actually changed
-        updated_data = {}
-        if username != user.username:
-            updated_data["username"] = username
-        if first_name != user.first_name:
-            updated_data["first_name"] = first_name
-        if last_name != user.last_name:
-            updated_data["last_name"] = last_name
-        if email != user.email:
-            updated_data["email"] = email
-        if role != user.role:
-            updated_data["role"] = role
-
-        return updated_data
+        return {
+            key: value for key, value in updated_data.items()
+            if value != getattr(user, key)
+        }
 
     @staticmethod
     def prompt_delete_confirmation(user):
@@ -249,26 +282,21 @@ class ClientView:
         Displays a list of clients in the CRM system.
 
         Args:
-            clients (list[Client]): List of Client objects to display.
+            clients (Iterable[Client]): Client objects to display (a list or a streamed query).
                                     If empty, a message is shown.
         """
-        if not clients:
-            print("No clients found in the database.")
-            return
-
-        print("\n=== List of Clients ===")
+        # Rows are collected and written in one call rather than one write per client.
+        # `clients` may be a streamed query, so emptiness is only known after iterating it.
+        lines = ["\n=== List of Clients ==="]
         for client in clients:
             # Format the dates for better readability
-            first_contact = client.first_contact.strftime("%Y-%m-%d %H:%M") if client.first_contact else "N/A"
-            last_update = client.last_update.strftime("%Y-%m-%d %H:%M") if client.last_update else "N/A"
+            first_contact = _format_datetime(client.first_contact)
+            last_update = _format_datetime(client.last_update)
 
             # Get commercial contact name if available
-            commercial_name = (
-                f"{client.commercial_contact.first_name} {client.commercial_contact.last_name}"
-                if client.commercial_contact else "None"
-            )
+            commercial_name = _full_name(client.commercial_contact, missing="None")
 
-            print(
+            lines.append(
                 f"ID: {client.client_id} | "
                 f"Name: {client.first_name} {client.last_name} | "
                 f"Business: {client.business_name} | "
@@ -279,6 +307,11 @@ class ClientView:
                 f"Commercial: {commercial_name}"
             )
 
+        if len(lines) == 1:
+            print("No clients found in the database.")
+            return
+        print("\n".join(lines))
+
     @staticmethod
     def prompt_client_creation():
         """
@@ -342,32 +375,30 @@ class ContractView:
         Displays a list of contracts in the CRM system.
 
         Args:
-            contracts (list[Contract]): List of Contract objects to display.
+            contracts (Iterable[Contract]): Contract objects to display (a list or a streamed query).
                                        If empty, a message is shown.
         """
-        if not contracts:
-            print("No contracts found in the database.")
-            return
-
-        print("\n=== List of Contracts ===")
+        lines = ["\n=== List of Contracts ==="]
         for contract in contracts:
             # Format client and commercial names
-            client_name = f"{contract.client.first_name} {contract.client.last_name}" if contract.client else "N/A"
-            commercial_name = (
-                f"{contract.commercial_contact.first_name} {contract.commercial_contact.last_name}"
-                if contract.commercial_contact else "N/A"
-            )
+            client_name = _full_name(contract.client)
+            commercial_name = _full_name(contract.commercial_contact)
 
-            print(
+            lines.append(
                 f"ID: {contract.contract_id} | "
                 f"Client: {client_name} | "
                 f"Commercial: {commercial_name} | "
                 f"Total: {contract.total_price}€ | "
                 f"Remaining: {contract.rest_to_pay}€ | "
                 f"Signed: {'Yes' if contract.signed else 'No'} | "
-                f"Created: {contract.creation.strftime('%Y-%m-%d %H:%M') if contract.creation else 'N/A'}"
+                f"Created: {_format_datetime(contract.creation)}"
             )
 
+        if len(lines) == 1:
+            print("No contracts found in the database.")
+            return
+        print("\n".join(lines))
+
     @staticmethod
     def prompt_contract_creation():
         """
@@ -382,8 +413,8 @@ class ContractView:
                   - signed (bool, optional): Whether the contract is signed. Defaults to False.
         """
         return {
-            "total_price": float(click.prompt("Total price (€)", type=float)),
-            "rest_to_pay": float(click.prompt("Remaining amount to pay (€)", type=float)),
+            "total_price": click.prompt("Total price (€)", type=float),
+            "rest_to_pay": click.prompt("Remaining amount to pay (€)", type=float),
             "client_id": click.prompt("Client", type=int),
             "commercial_contact_id": click.prompt("Commercial contact", type=int),
             "signed": click.confirm("Is the contract already signed?", default=False)
@@ -431,22 +462,15 @@ class EventView:
         Displays a list of events in the CRM system.
 
         Args:
-            events (list[Event]): List of Event objects to display.
+            events (Iterable[Event]): Event objects to display (a list or a streamed query).
         """
-        if not events:
-            print("No events found in the database.")
-            return
-
-        print("\n=== List of Events ===")
+        lines = ["\n=== List of Events ==="]
         for event in events:
             # Format client and support contact names
             client_name = f"{event.client.business_name}" if event.client else "N/A"
-            support_name = (
-                f"{event.support_contact.first_name} {event.support_contact.last_name}"
-                if event.support_contact else "N/A"
-            )
+            support_name = _full_name(event.support_contact)
 
-            print(
+            lines.append(
                 f"ID: {event.event_id} | "
                 f"Name: {event.name} | "
                 f"Client: {client_name} | "
@@ -457,6 +481,11 @@ class EventView:
                 f"Attendees: {event.attendees}"
             )
 
+        if len(lines) == 1:
+            print("No events found in the database.")
+            return
+        print("\n".join(lines))
+
     @staticmethod
     def prompt_event_creation():
         """
@@ -480,10 +509,7 @@ class EventView:
             """Helper to parse datetime input from user."""
             while True:
                 try:
-                    return datetime.strptime(
-                        click.prompt(prompt_text + " (YYYY-MM-DD HH:MM)"),
-                        "%Y-%m-%d %H:%M"
-                    )
+                    return _parse_datetime(click.prompt(prompt_text + " (YYYY-MM-DD HH:MM)"))
                 except ValueError:
                     print("Invalid format. Please use YYYY-MM-DD HH:MM (e.g., 2023-12-25 14:30).")
 
@@ -509,20 +535,20 @@ class EventView:
         Returns:
             dict: Updated fields (only modified fields are included).
         """
-        from datetime import datetime
-
         print(f"\nUpdating event: {event.name} (ID: {event.event_id})")
 
         def parse_datetime(prompt_text, current_value):
-            """Helper to parse datetime input from user."""
-            if not click.confirm(f"Update {prompt_text}?", default=False):
-                return current_value
+            """
+            Helper to parse datetime input from user.
+            A single prompt defaults to the current value: accepting it keeps the value unchanged.
+            """
+            current_text = _format_datetime(current_value) if current_value else None
             while True:
+                text = click.prompt(f"{prompt_text} (YYYY-MM-DD HH:MM)", default=current_text)
+                if text == current_text:
+                    return current_value
                 try:
-                    return datetime.strptime(
-                        click.prompt(f"New {prompt_text} (YYYY-MM-DD HH:MM)"),
-                        "%Y-%m-%d %H:%M"
-                    )
+                    return _parse_datetime(text)
                 except ValueError:
                     print("Invalid format. Please use YYYY-MM-DD HH:MM.")
 
@@ -530,8 +556,8 @@ class EventView:
         updated_data = {
             "name": click.prompt("Event name", default=event.name),
             "notes": click.prompt("Notes (optional)", default=event.notes or ""),
-            "start_datetime": parse_datetime("start date and time", event.start_datetime),
-            "end_datetime": parse_datetime("end date and time", event.end_datetime),
+            "start_datetime": parse_datetime("Start date and time", event.start_datetime),
+            "end_datetime": parse_datetime("End date and time", event.end_datetime),
             "location": click.prompt("Location (optional)", default=event.location or ""),
             "attendees": click.prompt("Number of attendees", default=event.attendees, type=int),
             "client_id": click.prompt("Client ID", default=event.client_id, type=int),
@@ -7,7 +7,7 @@ It includes a pytest fixture to create and manage database sessions.
 """
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text, event
 from sqlalchemy.orm import sessionmaker
 from epic_events.models import Base, User, Client, Contract, Event
 from epic_events.auth import hash_password, SessionContext
@@ -48,6 +48,38 @@ def db_session():
         Base.metadata.drop_all(engine)
 
 
+@pytest.fixture()
+def enforce_foreign_keys(db_session):
+    """
+    Enables SQLite foreign key enforcement (as MySQL does) for the duration of a test.
+    SQLite ignores foreign keys by default, and the connection is shared between tests.
+    """
+    db_session.execute(text("PRAGMA foreign_keys=ON"))
+    yield
+    db_session.rollback()
+    db_session.execute(text("PRAGMA foreign_keys=OFF"))
+
+
+@pytest.fixture()
+def count_statements(db_session):
+    """
+    Records every SQL statement sent to the test database for the duration of a test.
+
+    Yields the list of statements; tests call clear() on it once their data is set up,
+    so that only the statements of the code under test are counted.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def commercial_session(test_user):
     return SessionContext(
@@ -118,7 +118,8 @@ def test_update_user_duplicate_username_integration(db_session, management_sessi
 
 
 def test_delete_user_integration_success(
-        db_session, management_session, test_user, test_client, test_contract, test_event, capsys
+        db_session, enforce_foreign_keys, management_session, test_user, test_client, test_contract, test_event,
+        capsys
 ):
     """
     Full integration test:
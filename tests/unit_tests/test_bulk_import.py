@@ -0,0 +1,94 @@
+import pytest
+from click.testing import CliRunner
+from epic_events import bulk_import as bulk_import_module
+from epic_events.bulk_import import bulk_import
+from epic_events.models import User, Client
+from epic_events.auth import verify_password
+
+
+@pytest.fixture()
+def run_import(db_session, monkeypatch, tmp_path):
+    """Runs the bulk_import command on a CSV text, against the test database session."""
+    monkeypatch.setattr(bulk_import_module, "SessionLocal", lambda: db_session)
+
+    def run(table, csv_text, *options):
+        path = tmp_path / f"{table}.csv"
+        path.write_text(csv_text, encoding="utf-8")
+        return CliRunner().invoke(bulk_import, [table, str(path), *options])
+
+    return run
+
+
+def test_bulk_import_users_success(db_session, run_import):
+    """Test that every row is imported and plain text passwords are hashed."""
+    result = run_import(
+        "users",
+        "username,first_name,last_name,email,role,password\n"
+        "alice,Alice,Doe,alice@example.com,commercial,secret1\n"
+        "bob,Bob,Doe,bob@example.com,support,secret2\n"
+    )
+
+    assert result.exit_code == 0
+    assert "2 users imported" in result.output
+    alice = db_session.query(User).filter_by(username="alice").one()
+    assert verify_password("secret1", alice.password_hash)
+    assert db_session.query(User).count() == 2
+
+
+def test_bulk_import_unknown_column(db_session, run_import):
+    """Test that a header column unknown to the table is rejected before any insert."""
+    result = run_import("clients", "first_name,nickname\nJohn,Johnny\n")
+
+    assert result.exit_code == 1
+    assert "Invalid CSV file: Unknown column(s) for clients: nickname" in result.output
+    assert db_session.query(Client).count() == 0
+
+
+def test_bulk_import_invalid_int_cell(db_session, test_user, run_import):
+    """Test that an invalid integer cell is reported with its line and column."""
+    result = run_import(
+        "clients",
+        "first_name,email,commercial_contact_id\n"
+        "John,john@example.com,1\n"
+        "Jane,jane@example.com,notanint\n"
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid CSV file: line 3, column commercial_contact_id: invalid value 'notanint'" in result.output
+    assert db_session.query(Client).count() == 0
+
+
+def test_bulk_import_invalid_decimal_cell(run_import):
+    """Test that an invalid amount is reported as an invalid file instead of crashing."""
+    result = run_import("contracts", "client_id,total_price\n1,abc\n")
+
+    assert result.exit_code == 1
+    assert "Invalid CSV file: line 2, column total_price: invalid value 'abc'" in result.output
+
+
+def test_bulk_import_empty_password(db_session, run_import):
+    """Test that a user row with an empty password is rejected."""
+    result = run_import(
+        "users",
+        "username,email,role,password\n"
+        "alice,alice@example.com,commercial,\n"
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid CSV file: line 2, column password: password must not be empty" in result.output
+    assert db_session.query(User).count() == 0
+
+
+def test_bulk_import_rolls_back_earlier_chunks(db_session, run_import):
+    """Test that a failure in a later chunk rolls back the chunks already inserted."""
+    result = run_import(
+        "clients",
+        "first_name,email\n"
+        "John,john@example.com\n"
+        "Jane,john@example.com\n",
+        "--chunk-size", "1"
+    )
+
+    assert result.exit_code == 1
+    assert "Import failed" in result.output
+    assert db_session.query(Client).count() == 0
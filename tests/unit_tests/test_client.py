@@ -1,4 +1,6 @@
 import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import InvalidRequestError
 from epic_events.models import Client
 
 
@@ -16,7 +18,7 @@ def test_create_client_valid(db_session, test_user):
     assert client.email == "john@example.com"
     assert client.commercial_contact_id == test_user.user_id
     assert client.first_contact is not None
-    assert client.last_update is not None
+    assert client.last_update == client.first_contact
 
 
 def test_create_client_duplicate_email(db_session, test_user):
@@ -68,16 +70,18 @@ def test_create_client_empty_fields(db_session, test_user):
         )
 
 
-def test_create_client_invalid_commercial_contact(db_session):
-    """Test that creating a client with an invalid commercial_contact_id raises a ValueError."""
-    with pytest.raises(ValueError, match="CONTACT_NOT_FOUND"):
-        Client.create(
-            db=db_session,
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            commercial_contact_id=9999
-        )
+def test_create_client_invalid_commercial_contact(db_session, enforce_foreign_keys):
+    """Test that a client with an invalid commercial_contact_id is rejected by the foreign key on insert."""
+    client = Client.create(
+        db=db_session,
+        first_name="John",
+        last_name="Doe",
+        email="john@example.com",
+        commercial_contact_id=9999
+    )
+    db_session.add(client)
+    with pytest.raises(IntegrityError):
+        db_session.commit()
 
 
 def test_update_client(db_session, test_user):
@@ -209,3 +213,55 @@ def test_get_client_by_id(db_session, test_user):
 def test_get_client_by_invalid_id(db_session):
     """Test that getting a client with an invalid ID returns None."""
     assert Client.get_by_id(db_session, 9999) is None
+
+
+def test_create_many_clients(db_session, test_user):
+    """Test that several clients can be inserted in a single batch."""
+    Client.create_many(db_session, [
+        {"first_name": "John", "last_name": "Doe", "email": "john@example.com",
+         "commercial_contact_id": test_user.user_id},
+        {"first_name": "Jane", "last_name": "Doe", "email": "jane@example.com",
+         "commercial_contact_id": test_user.user_id},
+    ])
+    db_session.commit()
+
+    clients = Client.get_all(db_session)
+    assert len(clients) == 2
+    assert all(client.commercial_contact_id == test_user.user_id for client in clients)
+
+
+def test_update_client_ignores_non_updatable_fields(db_session, test_client):
+    """Test that Client.update ignores keys outside of its updatable fields."""
+    original_first_contact = test_client.first_contact
+    test_client.update(db=db_session, first_name="Updated", client_id=42, first_contact=None, contracts=[])
+    assert test_client.first_name == "Updated"
+    assert test_client.client_id != 42
+    assert test_client.first_contact == original_first_contact
+
+
+def test_get_all_clients_strict_loading(db_session, test_client, monkeypatch):
+    """With EPIC_STRICT_LOADING, listed clients load their commercial contact but refuse other lazy loads."""
+    monkeypatch.setenv("EPIC_STRICT_LOADING", "1")
+    db_session.expunge_all()
+    clients = Client.get_all(db_session)
+    assert clients[0].commercial_contact.username == "test_user"
+    with pytest.raises(InvalidRequestError):
+        clients[0].contracts
+
+
+def test_create_client_field_too_long(db_session, test_user):
+    """Test that a first name longer than its column is rejected before reaching the database."""
+    with pytest.raises(ValueError, match="FIELD_TOO_LONG"):
+        Client.create(
+            db=db_session,
+            first_name="a" * 65,
+            last_name="Client",
+            email="long.name@example.com",
+            commercial_contact_id=test_user.user_id
+        )
+
+
+def test_update_client_telephone_too_long(db_session, test_client):
+    """Test that a telephone number longer than its column is rejected on update."""
+    with pytest.raises(ValueError, match="FIELD_TOO_LONG"):
+        test_client.update(db=db_session, telephone="1" * 33)
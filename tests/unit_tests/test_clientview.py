@@ -11,6 +11,14 @@ def test_list_clients_empty(capsys, db_session):
     assert "No clients found in the database." in output
 
 
+def test_list_clients_empty_stream(capsys, db_session):
+    """Test that list_clients also detects an empty streamed result."""
+    ClientView.list_clients(iter([]))
+
+    output = capsys.readouterr().out
+    assert "No clients found in the database." in output
+
+
 def test_list_clients_with_commercial(capsys, db_session, test_client, test_user):
     """
     Test that list_clients prints the correct commercial contact information.
@@ -1,5 +1,7 @@
 import pytest
-from epic_events.models import Contract
+from decimal import Decimal
+from sqlalchemy.exc import IntegrityError
+from epic_events.models import Contract, Client
 
 
 def test_create_contract_valid(db_session, test_user, test_client):
@@ -58,6 +60,49 @@ def test_update_contract_rest_to_pay(db_session, test_user, test_client):
         contract.update(db=db_session, rest_to_pay=1500.00)
 
 
+def test_create_contract_amounts_are_rounded_decimals(db_session, test_user, test_client):
+    """Test that contract amounts are normalized to Decimal values rounded to the cent."""
+    contract = Contract.create(
+        db=db_session,
+        total_price=0.1 + 0.2,
+        rest_to_pay=0.125,
+        client_id=test_client.client_id,
+        commercial_contact_id=test_user.user_id
+    )
+    assert contract.total_price == Decimal("0.30")
+    assert contract.rest_to_pay == Decimal("0.13")
+
+
+def test_create_contract_nan_total_price(db_session, test_user, test_client):
+    """Test that a NaN total_price is rejected with INVALID_AMOUNT."""
+    with pytest.raises(ValueError, match="INVALID_AMOUNT"):
+        Contract.create(
+            db=db_session,
+            total_price=float("nan"),
+            rest_to_pay=0,
+            client_id=test_client.client_id,
+            commercial_contact_id=test_user.user_id
+        )
+
+
+def test_create_contract_infinite_total_price(db_session, test_user, test_client):
+    """Test that an infinite total_price is rejected with INVALID_AMOUNT instead of failing in quantize."""
+    with pytest.raises(ValueError, match="INVALID_AMOUNT"):
+        Contract.create(
+            db=db_session,
+            total_price=float("inf"),
+            rest_to_pay=0,
+            client_id=test_client.client_id,
+            commercial_contact_id=test_user.user_id
+        )
+
+
+def test_update_contract_non_finite_rest_to_pay(db_session, test_contract):
+    """Test that a NaN rest_to_pay is rejected on update."""
+    with pytest.raises(ValueError, match="INVALID_AMOUNT"):
+        test_contract.update(db=db_session, rest_to_pay=float("nan"))
+
+
 def test_contract_creation_date(db_session, test_user, test_client):
     """Test that a contract's creation date is set on creation."""
     contract = Contract.create(
@@ -90,10 +135,24 @@ def test_create_contract_with_none_commercial_id(db_session, test_client):
             total_price=1000.00,
             rest_to_pay=500.00,
             client_id=test_client.client_id,
-            commercial_contact_id=9999
+            commercial_contact_id=None
         )
 
 
+def test_create_contract_with_unknown_commercial_id(db_session, enforce_foreign_keys, test_client):
+    """Test that a contract with an unknown commercial_contact_id is rejected by the foreign key on insert."""
+    contract = Contract.create(
+        db=db_session,
+        total_price=1000.00,
+        rest_to_pay=500.00,
+        client_id=test_client.client_id,
+        commercial_contact_id=9999
+    )
+    db_session.add(contract)
+    with pytest.raises(IntegrityError):
+        db_session.commit()
+
+
 def test_update_contract_with_invalid_client_id(db_session, test_user, test_client):
     """Test that updating a contract with an invalid client_id raises a ValueError."""
     contract = Contract.create(
@@ -179,3 +238,71 @@ def test_get_pending_contracts(db_session, test_user, test_client):
     assert contract3.contract_id in pending_ids
     assert contract1.contract_id not in pending_ids
 
+
+def test_create_many_contracts(db_session, test_user, test_client):
+    """Test that several contracts can be inserted in a single batch."""
+    Contract.create_many(db_session, [
+        {"total_price": 1000, "rest_to_pay": 0, "signed": True,
+         "client_id": test_client.client_id, "commercial_contact_id": test_user.user_id},
+        {"total_price": 500, "rest_to_pay": 500, "signed": False,
+         "client_id": test_client.client_id, "commercial_contact_id": test_user.user_id},
+    ])
+    db_session.commit()
+
+    assert len(Contract.get_all(db_session)) == 2
+    assert len(Contract.get_pending_contracts(db_session)) == 1
+
+
+def test_update_contract_with_loaded_client_skips_probe(
+        db_session, test_user, test_client, test_contract, count_statements
+):
+    """Test that reassigning a contract to a client already loaded in the session issues no SQL."""
+    other_client = Client.create(
+        db=db_session,
+        first_name="Other",
+        last_name="Client",
+        email="other@example.com",
+        commercial_contact_id=test_user.user_id
+    )
+    db_session.add(other_client)
+    db_session.commit()
+    other_client_id = other_client.client_id
+    db_session.refresh(test_contract)
+    count_statements.clear()
+    test_contract.update(db=db_session, client_id=other_client_id)
+
+    assert test_contract.client_id == other_client_id
+    assert count_statements == []
+
+
+def test_get_contract_by_id_with_related_single_query(db_session, test_contract, count_statements):
+    """Test that loading a contract with its related rows issues one SELECT and no lazy loads."""
+    contract_id = test_contract.contract_id
+    db_session.expunge_all()
+    count_statements.clear()
+    contract = Contract.get_by_id(db_session, contract_id, with_related=True)
+    client_name = contract.client.business_name
+    commercial_name = contract.commercial_contact.first_name
+
+    assert client_name == "business test"
+    assert commercial_name == "Test"
+    assert len(count_statements) == 1
+
+
+def test_get_all_contracts_loads_relationships_in_constant_queries(
+        db_session, test_user, test_client, count_statements
+):
+    """Test that listing contracts with their client and commercial costs the same queries for 1 or N rows."""
+    for _ in range(5):
+        db_session.add(Contract.create(db_session, 1000, 500, test_client.client_id, test_user.user_id))
+    db_session.commit()
+    db_session.expunge_all()
+    count_statements.clear()
+    names = [
+        (contract.client.first_name, contract.commercial_contact.first_name)
+        for contract in Contract.get_all(db_session)
+    ]
+
+    assert len(names) == 5
+    # One SELECT for the contracts, plus one SELECT ... IN per relationship
+    assert len(count_statements) == 3
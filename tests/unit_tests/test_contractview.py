@@ -1,6 +1,7 @@
 import pytest
 import click
 from epic_events.views import ContractView
+from epic_events.models import Contract
 
 
 def test_list_contracts_empty(capsys, db_session):
@@ -137,3 +138,15 @@ def test_prompt_update_abort(monkeypatch, db_session, test_contract):
 
     with pytest.raises(click.Abort):
         ContractView.prompt_update(test_contract)
+
+
+def test_list_contracts_strict_loading_query_budget(capsys, monkeypatch, db_session, test_contract, count_statements):
+    """Test that the contract list renders under EPIC_STRICT_LOADING (no lazy load) within three queries."""
+    monkeypatch.setenv("EPIC_STRICT_LOADING", "1")
+    contract_id = test_contract.contract_id
+    db_session.expunge_all()
+    count_statements.clear()
+    ContractView.list_contracts(Contract.iter_all(db_session))
+
+    assert f"ID: {contract_id}" in capsys.readouterr().out
+    assert len(count_statements) <= 3
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch
 from epic_events.controllers import (
-    DisplayMessages, UserController, ClientController, ContractController, EventController
+    DisplayMessages, MenuController, UserController, ClientController, ContractController, EventController
 )
 from epic_events.views import UserView, MenuView, ClientView, ContractView, EventView
 from epic_events.models import User, Client, Contract, Event
@@ -54,6 +54,25 @@ def test_create_user_value_error(db_session, management_session):
                 mock_error.assert_called_once_with("USERNAME_TAKEN")
 
 
+def test_create_user_unique_violation_maps_to_taken(db_session, management_session, test_user):
+    """Test that a user taken between validation and commit is reported as EMAIL_TAKEN, not a database error."""
+    user_data = {
+        "username": "newcomer",
+        "first_name": "New",
+        "last_name": "Comer",
+        "email": test_user.email,
+        "role": "support",
+        "password": "testpassword"
+    }
+    racing_user = User(username="newcomer", first_name="New", last_name="Comer", email=test_user.email,
+                       role="support", password_hash="hash")
+    with patch.object(UserView, "prompt_user_creation", return_value=user_data):
+        with patch.object(User, "create", return_value=racing_user):
+            with patch.object(DisplayMessages, "display_error") as mock_error:
+                UserController.create_user(db_session, management_session)
+                mock_error.assert_called_once_with("EMAIL_TAKEN")
+
+
 def test_create_user_exception(db_session, management_session):
     """Test that generic Exception triggers rollback, error display, and re-raises."""
     with patch.object(UserView, "prompt_user_creation", return_value={
@@ -152,13 +171,13 @@ def test_list_clients_success(db_session, commercial_session, test_client):
 
         mock_view.assert_called_once()
         # verify the list passed contains our test_client
-        passed_list = mock_view.call_args[0][0]
+        passed_list = list(mock_view.call_args[0][0])
         assert len(passed_list) == 1
         assert passed_list[0].client_id == test_client.client_id
 
 
 def test_list_clients_database_error(db_session, commercial_session):
-    with patch.object(Client, "get_all", side_effect=Exception("DB failure")):
+    with patch.object(Client, "iter_all", side_effect=Exception("DB failure")):
         with patch.object(DisplayMessages, "display_error") as mock_error:
             with pytest.raises(Exception):
                 ClientController.list_clients(db_session, commercial_session)
@@ -233,7 +252,7 @@ def test_list_contracts_success(db_session, commercial_session, test_contract):
         ContractController.list_contracts(db_session, commercial_session)
 
         mock_list.assert_called_once()
-        passed_contracts = mock_list.call_args[0][0]
+        passed_contracts = list(mock_list.call_args[0][0])
 
         assert len(passed_contracts) == 1
         assert passed_contracts[0].contract_id == test_contract.contract_id
@@ -243,7 +262,7 @@ def test_list_contracts_success(db_session, commercial_session, test_contract):
 def test_list_contracts_database_error(db_session, commercial_session):
     """Test database error handling during contract listing."""
 
-    with patch("epic_events.models.Contract.get_all", side_effect=Exception("DB ERROR")), \
+    with patch("epic_events.models.Contract.iter_all", side_effect=Exception("DB ERROR")), \
             patch.object(DisplayMessages, "display_error") as mock_error:
         with pytest.raises(Exception):
             ContractController.list_contracts(db_session, commercial_session)
@@ -299,6 +318,24 @@ def test_create_contract_validation_error(db_session, management_session, test_u
         mock_error.assert_called_once_with("INVALID_TOTAL_PRICE")
 
 
+def test_create_contract_unknown_client(db_session, enforce_foreign_keys, management_session, test_user):
+    """Test that a foreign key violation on an unknown client is reported as CLIENT_NOT_FOUND."""
+
+    contract_data = {
+        "total_price": 1000.0,
+        "rest_to_pay": 200.0,
+        "client_id": 9999,
+        "commercial_contact_id": test_user.user_id,
+    }
+
+    with patch.object(ContractView, "prompt_contract_creation", return_value=contract_data), \
+            patch.object(DisplayMessages, "display_error") as mock_error:
+        ContractController.create_contract(db_session, management_session)
+
+        mock_error.assert_called_once_with("CLIENT_NOT_FOUND")
+        assert db_session.query(Contract).count() == 0
+
+
 def test_create_contract_database_error(db_session, management_session, test_user, test_client):
     """Test unexpected database error during contract creation."""
 
@@ -407,7 +444,7 @@ def test_list_events_success(db_session, support_session, test_event):
 
     fake_events = [test_event]
 
-    with patch.object(Event, "get_all", return_value=fake_events) as mock_get_all, \
+    with patch.object(Event, "iter_all", return_value=fake_events) as mock_get_all, \
             patch("epic_events.views.EventView.list_events") as mock_list_events:
         EventController.list_events(db_session, support_session)
 
@@ -418,7 +455,7 @@ def test_list_events_success(db_session, support_session, test_event):
 def test_list_events_db_error(db_session, support_session):
     """Test DB error during event listing."""
 
-    with patch.object(Event, "get_all", side_effect=Exception("DB error")) as mock_get_all, \
+    with patch.object(Event, "iter_all", side_effect=Exception("DB error")) as mock_get_all, \
             patch("epic_events.views.DisplayMessages.display_error") as mock_display:
         with pytest.raises(Exception):
             EventController.list_events(db_session, support_session)
@@ -622,3 +659,14 @@ def test_assign_support(db_session, management_session, test_event, test_user):
         mock_success.assert_called_once()
         msg = mock_success.call_args[0][0]
         assert f"Support {support_user.username} assigned to event" in msg
+
+
+def test_clients_menu_dispatches_choices(db_session, commercial_session):
+    """Test the clients submenu: invalid choices are reported, valid ones dispatched, 'back' exits the loop."""
+    with patch.object(MenuView, "display_clients_menu", side_effect=["9", "1", "4"]), \
+            patch.object(ClientController, "list_clients") as mock_list, \
+            patch.object(DisplayMessages, "display_invalid_choice") as mock_invalid:
+        MenuController.run_clients_menu(db_session, commercial_session)
+
+        mock_invalid.assert_called_once_with("clients")
+        mock_list.assert_called_once_with(db_session, commercial_session)
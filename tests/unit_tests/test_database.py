@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy import text
-from epic_events.database import engine, SessionLocal
+from sqlalchemy.pool import NullPool, QueuePool
+from epic_events.database import engine, SessionLocal, get_engine
 
 
 def test_database_connection():
@@ -38,3 +39,12 @@ def test_session_creation():
         print("✅ SQLAlchemy session created and closed successfully!")
     except Exception as e:
         pytest.fail(f"❌ Session creation error: {e}")
+
+
+def test_get_engine_null_pool_flag(monkeypatch):
+    """Test that DB_NULL_POOL disables pooling only for explicit true values."""
+    monkeypatch.setenv("DB_NULL_POOL", "true")
+    assert isinstance(get_engine().pool, NullPool)
+
+    monkeypatch.setenv("DB_NULL_POOL", "0")
+    assert isinstance(get_engine().pool, QueuePool)
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from epic_events.models import Event
 
 
@@ -154,6 +154,18 @@ def test_update_event_invalid_client_id(db_session, test_user, test_client, test
         )
 
 
+def test_update_event_invalid_support_contact_id(db_session, test_user, test_client, test_event):
+    """Test that updating an event with an unknown support contact raises a ValueError."""
+    with pytest.raises(ValueError, match="CONTACT_NOT_FOUND"):
+        test_event.update(db=db_session, support_contact_id=9999)
+
+
+def test_update_event_invalid_client_and_support_contact_ids(db_session, test_user, test_client, test_event):
+    """Test that when both references are unknown, the client error is reported first."""
+    with pytest.raises(ValueError, match="CLIENT_NOT_FOUND"):
+        test_event.update(db=db_session, client_id=9999, support_contact_id=9999)
+
+
 def test_update_event_past_date(db_session, test_user, test_client, test_event):
     """Test that updating an event with a past start_datetime raises a ValueError."""
     with pytest.raises(ValueError, match="EVENT_DATE_IN_PAST"):
@@ -163,6 +175,27 @@ def test_update_event_past_date(db_session, test_user, test_client, test_event):
         )
 
 
+def test_update_event_past_date_timezone_aware(db_session, test_user, test_client, test_event):
+    """Test that a timezone-aware past start_datetime is also rejected."""
+    with pytest.raises(ValueError, match="EVENT_DATE_IN_PAST"):
+        test_event.update(
+            db=db_session,
+            start_datetime=datetime.now(timezone.utc) - timedelta(hours=1)
+        )
+
+
+def test_update_event_end_timezone_aware(db_session, test_user, test_client, test_event):
+    """Test that a timezone-aware end_datetime is compared and stored as naive local time."""
+    new_end = datetime.now(timezone.utc) + timedelta(days=32)
+    test_event.update(db=db_session, end_datetime=new_end)
+
+    assert test_event.end_datetime.tzinfo is None
+    assert test_event.end_datetime == new_end.astimezone().replace(tzinfo=None)
+
+    with pytest.raises(ValueError, match="END_BEFORE_START"):
+        test_event.update(db=db_session, end_datetime=datetime.now(timezone.utc) + timedelta(days=4))
+
+
 def test_update_event_end_before_start(db_session, test_user, test_client, test_event):
     """Test that updating an event with end_datetime before start_datetime raises a ValueError."""
     with pytest.raises(ValueError, match="END_BEFORE_START"):
@@ -253,3 +286,34 @@ def test_get_assigned_events(db_session, support_session, test_client, test_cont
     assert len(assigned_events) == 1
     assert assigned_events[0].name == event_unassigned.name
     assert assigned_events[0].support_contact_id == support_session.user_id
+
+
+def test_create_many_events(db_session, test_user, test_client, test_contract):
+    """Test that several events can be inserted in a single batch."""
+    start = datetime.now() + timedelta(days=30)
+    Event.create_many(db_session, [
+        {"name": "Event 1", "start_datetime": start, "end_datetime": start + timedelta(hours=2),
+         "client_id": test_client.client_id},
+        {"name": "Event 2", "start_datetime": start, "end_datetime": start + timedelta(hours=4),
+         "client_id": test_client.client_id, "support_contact_id": test_user.user_id},
+    ])
+    db_session.commit()
+
+    assert len(Event.get_all(db_session)) == 2
+    assert len(Event.get_unassigned_events(db_session)) == 1
+
+
+def test_iter_all_events_streams_every_event(db_session, test_user, test_client, test_contract):
+    """Test that iter_all yields every event across several chunks, with relationships loaded."""
+    start = datetime.now() + timedelta(days=30)
+    Event.create_many(db_session, [
+        {"name": f"Event {i}", "start_datetime": start, "end_datetime": start + timedelta(hours=2),
+         "client_id": test_client.client_id}
+        for i in range(5)
+    ])
+    db_session.commit()
+
+    events = list(Event.iter_all(db_session, chunk_size=2))
+
+    assert sorted(event.name for event in events) == [f"Event {i}" for i in range(5)]
+    assert all(event.client is test_client for event in events)
@@ -1,8 +1,8 @@
 import pytest
 import click
-from epic_events.views import EventView
+from epic_events.views import EventView, _parse_datetime, _format_datetime
 from epic_events.models import Event
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 
 def test_list_events_empty(capsys, db_session):
@@ -159,8 +159,8 @@ def test_prompt_update_no_changes(db_session, monkeypatch, test_event):
     answers = iter([
         event.name,
         event.notes or "",
-        False,
-        False,
+        _format_datetime(event.start_datetime),
+        _format_datetime(event.end_datetime),
         event.location or "",
         event.attendees,
         event.client_id,
@@ -168,7 +168,6 @@ def test_prompt_update_no_changes(db_session, monkeypatch, test_event):
     ])
 
     monkeypatch.setattr("click.prompt", lambda *a, **kw: next(answers))
-    monkeypatch.setattr("click.confirm", lambda *a, **kw: next(answers))
 
     result = EventView.prompt_update(event)
     assert result == {}
@@ -191,10 +190,7 @@ def test_prompt_update_some_changes(db_session, monkeypatch, test_event):
         event.support_contact_id
     ])
 
-    answers_confirm = iter([True, True])
-
     monkeypatch.setattr("click.prompt", lambda *a, **kw: next(answers_prompt))
-    monkeypatch.setattr("click.confirm", lambda *a, **kw: next(answers_confirm))
 
     result = EventView.prompt_update(event)
 
@@ -211,3 +207,42 @@ def test_prompt_update_abort(db_session, monkeypatch, test_event):
 
     with pytest.raises(click.Abort):
         EventView.prompt_update(test_event)
+
+
+def test_parse_datetime_formats():
+    """Test that _parse_datetime accepts padded and unpadded dates and rejects other formats."""
+    assert _parse_datetime("2023-12-25 14:30") == datetime(2023, 12, 25, 14, 30)
+    assert _parse_datetime("2023-1-5 4:30") == datetime(2023, 1, 5, 4, 30)
+    for text in ("2023-12-25", "2023-12-25T14:30", "2023-W01-1 14:30"):
+        with pytest.raises(ValueError):
+            _parse_datetime(text)
+
+
+def test_format_datetime():
+    """Test that _format_datetime matches the display format and handles missing and aware values."""
+    value = datetime(2023, 1, 5, 4, 30, 59)
+    assert _format_datetime(value) == value.strftime("%Y-%m-%d %H:%M") == "2023-01-05 04:30"
+    assert _format_datetime(value.replace(tzinfo=timezone.utc)) == "2023-01-05 04:30"
+    assert _format_datetime(None) == "N/A"
+
+
+def test_prompt_update_invalid_datetime_retries(db_session, monkeypatch, test_event, capsys):
+    """Test that an invalid date is asked again and that accepting the default keeps the current value."""
+    event = test_event
+    answers = iter([
+        event.name,
+        event.notes or "",
+        "not a date",
+        "2030-01-01 10:00",
+        _format_datetime(event.end_datetime),
+        event.location or "",
+        event.attendees,
+        event.client_id,
+        event.support_contact_id
+    ])
+    monkeypatch.setattr("click.prompt", lambda *a, **kw: next(answers))
+
+    result = EventView.prompt_update(event)
+
+    assert result == {"start_datetime": datetime(2030, 1, 1, 10, 0)}
+    assert "Invalid format" in capsys.readouterr().out
@@ -1,7 +1,8 @@
 import click
 from click.testing import CliRunner
 import pytest
-from epic_events.views import MenuView
+from epic_events.views import MenuView, DisplayMessages
+from epic_events.utils import ErrorMessages
 
 
 def test_prompt_for_id(monkeypatch):
@@ -14,3 +15,20 @@ def test_prompt_for_contact_id(monkeypatch):
     """Test that prompt_for_contact_id returns the integer provided by the mocked user input."""
     monkeypatch.setattr("click.prompt", lambda msg, type: 7)
     assert MenuView.prompt_for_contact_id("client") == 7
+
+
+def test_display_messages_output(capsys):
+    """Test that success and error messages are written as single lines to stdout."""
+    DisplayMessages.display_success("Saved")
+    DisplayMessages.display_error("ACCESS_DENIED")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "✅ Saved"
+    assert lines[1].startswith("❌ Error: ")
+
+
+def test_display_error_unknown_key_uses_default(capsys):
+    """Test that an unknown error key falls back to the same default message as get_message."""
+    DisplayMessages.display_error("NON_EXISTENT_KEY")
+
+    assert capsys.readouterr().out == f"❌ Error: {ErrorMessages.get_message('NON_EXISTENT_KEY')}\n"
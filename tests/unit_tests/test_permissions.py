@@ -227,3 +227,67 @@ def test_requires_authentication_allows_valid_session(db_session):
     result = fake_controller(db_session, session)
 
     assert result == "OK"
+
+
+def test_requires_authentication_finds_session_at_any_position(db_session):
+    """
+        Ensure that the session is found from the decorated function's signature,
+        whether it is passed positionally at its own index or as a keyword.
+    """
+    session = SessionContext(
+        username="test",
+        user_id=1,
+        role="management",
+        is_authenticated=True
+    )
+
+    @requires_authentication
+    def fake_controller(db, event_id, session):
+        return event_id
+
+    assert fake_controller(db_session, 42, session) == 42
+    assert fake_controller(db_session, 42, session=session) == 42
+    assert fake_controller(db_session, 42, None) is None
+
+
+def test_commercial_only_rechecks_session_after_role_change(monkeypatch):
+    """Should deny access once the role of a previously approved session changes."""
+
+    session = SessionContext(
+        username="john", user_id=98,
+        role="commercial",
+        is_authenticated=True
+    )
+
+    @commercial_only
+    def protected_function(*args, **kwargs):
+        return "OK"
+
+    monkeypatch.setattr(
+        DisplayMessages,
+        "display_error",
+        lambda msg: msg
+    )
+
+    assert protected_function(session=session) == "OK"
+    session.role = "support"
+    assert protected_function(session=session) is None
+
+
+def test_requires_authentication_denies_approved_session_once_expired(db_session):
+    """Should deny access to a previously approved session once it has expired."""
+    session = SessionContext(
+        username="test",
+        user_id=1,
+        role="management",
+        is_authenticated=True
+    )
+
+    @requires_authentication
+    def fake_controller(db, session):
+        return "OK"
+
+    assert fake_controller(db_session, session) == "OK"
+    session.created_at = datetime.now() - timedelta(minutes=20)
+    assert fake_controller(db_session, session) is None
+    assert session.is_authenticated is False
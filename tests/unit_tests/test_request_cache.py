@@ -0,0 +1,100 @@
+from sqlalchemy.orm import Session
+from epic_events.models import User, Client
+from epic_events.request_cache import request_scope, get_request_cache
+
+
+def test_no_cache_outside_request_scope():
+    """Outside of a request scope, no cache is active."""
+    assert get_request_cache() is None
+
+
+def test_request_scope_resets_cache():
+    """Each request scope starts empty and is discarded on exit."""
+    with request_scope():
+        get_request_cache()["key"] = "value"
+    with request_scope():
+        assert get_request_cache() == {}
+    assert get_request_cache() is None
+
+
+def test_get_user_by_id_is_memoized_in_request_scope(db_session, test_user, count_statements):
+    """Repeated lookups of the same user within one request issue a single query."""
+    user_id = test_user.user_id
+    db_session.expunge_all()
+    count_statements.clear()
+    with request_scope():
+        first = User.get_by_id(db_session, user_id)
+        second = User.get_by_id(db_session, user_id)
+
+    assert first is second
+    assert len(count_statements) == 1
+
+
+def test_get_by_id_cache_is_keyed_per_model(db_session, test_user, test_client):
+    """Rows of different tables sharing the same primary key do not collide in the cache."""
+    with request_scope():
+        user = User.get_by_id(db_session, test_user.user_id)
+        client = Client.get_by_id(db_session, test_client.client_id)
+        assert test_user.user_id == test_client.client_id
+        assert User.get_by_id(db_session, test_user.user_id) is user
+        assert Client.get_by_id(db_session, test_client.client_id) is client
+
+
+def test_get_by_id_cache_is_keyed_per_session(db_session, test_user):
+    """A row cached for one session is not handed back to another session."""
+    other_session = Session(bind=db_session.get_bind())
+    try:
+        with request_scope():
+            user = User.get_by_id(db_session, test_user.user_id)
+            other_user = User.get_by_id(other_session, test_user.user_id)
+            assert other_user is not user
+            assert other_user in other_session
+    finally:
+        other_session.close()
+
+
+def test_update_evicts_cached_row(db_session, test_client):
+    """Updating a row removes it from the request cache."""
+    with request_scope():
+        client = Client.get_by_id(db_session, test_client.client_id)
+        assert (id(db_session), "clients", client.client_id) in get_request_cache()
+        client.update(db_session, first_name="Updated")
+        assert (id(db_session), "clients", client.client_id) not in get_request_cache()
+
+
+def test_request_cache_evicts_least_recently_used(monkeypatch):
+    """The request cache keeps at most REQUEST_CACHE_SIZE entries, dropping the least recently used."""
+    monkeypatch.setattr("epic_events.request_cache.REQUEST_CACHE_SIZE", 2)
+    with request_scope():
+        cache = get_request_cache()
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        assert list(cache) == ["a", "c"]
+
+
+def test_request_cache_cleared_on_commit_and_rollback(db_session, test_user):
+    """Ending a transaction drops the session's cached rows, so they are re-read in the next one."""
+    with request_scope():
+        User.get_by_id(db_session, test_user.user_id)
+        assert get_request_cache()
+        db_session.commit()
+        assert not get_request_cache()
+
+        User.get_by_id(db_session, test_user.user_id)
+        db_session.rollback()
+        assert not get_request_cache()
+
+
+def test_commit_keeps_other_sessions_entries(db_session, test_user):
+    """A commit only drops the entries of the session that committed."""
+    other_session = Session(bind=db_session.get_bind())
+    try:
+        with request_scope():
+            User.get_by_id(db_session, test_user.user_id)
+            User.get_by_id(other_session, test_user.user_id)
+            other_session.commit()
+            assert list(get_request_cache()) == [(id(db_session), "users", test_user.user_id)]
+    finally:
+        other_session.close()
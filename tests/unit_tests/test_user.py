@@ -77,6 +77,13 @@ def test_create_user_invalid_role(db_session):
                     password_hash="testpassword")
 
 
+def test_create_user_non_string_role(db_session):
+    """Test that a role of the wrong type is rejected as INVALID_ROLE rather than crashing the lookup."""
+    with pytest.raises(ValueError, match="INVALID_ROLE"):
+        User.create(db_session, "jdoe", "John", "Doe", "john@example.com", ["commercial"],
+                    password_hash="testpassword")
+
+
 def test_get_all_users(db_session):
     """Test retrieving all users."""
     # Create a few test users
@@ -157,6 +164,17 @@ def test_update_user_duplicate_email(db_session, test_user):
         user1.update(db_session, email="test@example.com")
 
 
+def test_update_user_duplicate_username(db_session, test_user):
+    """Test that updating a user with a duplicate username raises a ValueError."""
+    user1 = User.create(db_session, "jdoe1", "John", "Doe", "john@example.com", "commercial",
+                        password_hash="testpassword")
+    db_session.add(user1)
+
+    db_session.commit()
+    with pytest.raises(ValueError, match="USERNAME_TAKEN"):
+        user1.update(db_session, username="test_user")
+
+
 def test_update_user_with_none_values(db_session):
     """Test that updating a user with None values does not change existing values."""
     user = User.create(db_session, "jdoe", "John", "Doe", "john@example.com", "commercial",
@@ -176,34 +194,105 @@ def test_delete_user(db_session):
     assert User.get_by_id(db_session, user_id) is None
 
 
-def test_user_delete_dissociates_dependencies(db_session):
+def test_user_delete_dissociates_dependencies(db_session, enforce_foreign_keys, test_user, test_client,
+                                              test_contract, test_event):
     """
-        Unit test: Verify that User.delete() dissociates dependencies (clients, contracts, events).
-        This test focuses solely on the dissociation logic, without database persistence.
+        Unit test: Verify that deleting a user with User.delete() leaves its clients, contracts
+        and events in place, dissociated by the database (ON DELETE SET NULL).
         """
-    user = User(
-        username="jdoe",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        role="commercial",
-        password_hash="testpassword"
-    )
+    user_id = test_user.user_id
+    test_user.delete(db_session)
+    db_session.commit()
+
+    assert db_session.query(Client).filter(Client.commercial_contact_id == user_id).count() == 0
+    assert db_session.query(Contract).filter(Contract.commercial_contact_id == user_id).count() == 0
+    assert db_session.query(Event).filter(Event.support_contact_id == user_id).count() == 0
+    assert test_client.commercial_contact_id is None
+    assert test_contract.commercial_contact_id is None
+    assert test_event.support_contact_id is None
+    assert db_session.query(Client).count() == 1
+
+
+def test_create_many_users(db_session):
+    """Test that several users can be inserted in a single batch."""
+    User.create_many(db_session, [
+        {"username": "user1", "first_name": "User", "last_name": "One", "email": "user1@example.com",
+         "role": "commercial", "password_hash": "testpassword"},
+        {"username": "user2", "first_name": "User", "last_name": "Two", "email": "user2@example.com",
+         "role": "support", "password_hash": "testpassword"},
+    ])
+    db_session.commit()
 
-    client = Client(commercial_contact_id=user.user_id)
-    contract = Contract(commercial_contact_id=user.user_id)
-    event = Event(support_contact_id=user.user_id)
+    usernames = sorted(user.username for user in User.get_all(db_session))
+    assert usernames == ["user1", "user2"]
 
-    user.clients = [client]
-    user.contracts = [contract]
-    user.events = [event]
 
-    assert client.commercial_contact_id == user.user_id
-    assert contract.commercial_contact_id == user.user_id
-    assert event.support_contact_id == user.user_id
+def test_create_user_does_not_autoflush_pending_users(db_session):
+    """Test that the uniqueness check of User.create does not flush users already pending in the session."""
+    db_session.autoflush = True
+    pending = User.create(db_session, "user1", "User", "One", "user1@example.com", "commercial",
+                          password_hash="testpassword")
+    db_session.add(pending)
+
+    User.create(db_session, "user2", "User", "Two", "user2@example.com", "support",
+                password_hash="testpassword")
+
+    assert pending in db_session.new
+
+
+def test_create_many_users_rejects_taken_email(db_session, test_user):
+    """Test that a batch containing an email already used by a stored user is rejected before inserting."""
+    with pytest.raises(ValueError, match="EMAIL_TAKEN"):
+        User.create_many(db_session, [
+            {"username": "user1", "first_name": "User", "last_name": "One", "email": test_user.email,
+             "role": "commercial", "password_hash": "testpassword"},
+        ])
+    assert len(User.get_all(db_session)) == 1
+
+
+def test_create_many_users_rejects_duplicates_within_batch(db_session):
+    """Test that a batch repeating the same username is rejected."""
+    row = {"username": "user1", "first_name": "User", "last_name": "One", "email": "user1@example.com",
+           "role": "commercial", "password_hash": "testpassword"}
+    with pytest.raises(ValueError, match="USERNAME_TAKEN"):
+        User.create_many(db_session, [row, dict(row, email="other@example.com")])
+
+
+def test_get_user_by_id_uses_identity_map(db_session, test_user, count_statements):
+    """Test that fetching a user already loaded in the session issues no SQL, even outside a request scope."""
+    db_session.refresh(test_user)
+    count_statements.clear()
+    fetched_user = User.get_by_id(db_session, test_user.user_id)
+
+    assert fetched_user is test_user
+    assert count_statements == []
+
+
+def test_get_user_id_list(db_session, test_user):
+    """Test that get_id_list returns lightweight (user_id, username) rows."""
+    rows = User.get_id_list(db_session)
+    assert [(row.user_id, row.username) for row in rows] == [(test_user.user_id, test_user.username)]
+    assert not isinstance(rows[0], User)
+
+
+def test_deleting_user_row_nulls_references(db_session, enforce_foreign_keys, test_user, test_client):
+    """Test that the database itself dissociates clients when a user row is deleted (ON DELETE SET NULL)."""
+    client_id = test_client.client_id
+    db_session.delete(test_user)
+    db_session.commit()
+    db_session.expunge_all()
+
+    assert Client.get_by_id(db_session, client_id).commercial_contact_id is None
+
+
+def test_get_identity_conflict(db_session, test_user):
+    """Test that get_identity_conflict reports the taken username first, then the taken email."""
+    assert User.get_identity_conflict(db_session, "test_user", "test@example.com") == "USERNAME_TAKEN"
+    assert User.get_identity_conflict(db_session, "someone_else", "test@example.com") == "EMAIL_TAKEN"
+    assert User.get_identity_conflict(db_session, "someone_else", "free@example.com") is None
 
-    user.delete(db_session)
 
-    assert client.commercial_contact_id is None
-    assert contract.commercial_contact_id is None
-    assert event.support_contact_id is None
+def test_update_user_last_name_too_long(db_session, test_user):
+    """Test that a last name longer than its column is rejected on update."""
+    with pytest.raises(ValueError, match="FIELD_TOO_LONG"):
+        test_user.update(db=db_session, last_name="b" * 65)
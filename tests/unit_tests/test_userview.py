@@ -20,8 +20,8 @@ def test_prompt_user_creation(monkeypatch, db_session):
 
     assert result == {
         "username": "fake_Username (max 100 chars)",
-        "first_name": "fake_First name (max 100 chars)",
-        "last_name": "fake_Last name (max 100 chars)",
+        "first_name": "fake_First name (max 64 chars)",
+        "last_name": "fake_Last name (max 64 chars)",
         "email": "john@example.com",
         "role": "commercial",
         "password": "testpassword"
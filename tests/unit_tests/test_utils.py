@@ -29,3 +29,10 @@ def test_validate_length_too_long(monkeypatch, capsys):
     captured = capsys.readouterr().out
     assert "Error: Input must be 5 characters or less" in captured
     assert result == "ok"
+
+
+def test_validate_length_with_values_returns_first_valid(monkeypatch):
+    """Test that validate_length picks the first pre-supplied value within max_length without prompting"""
+    monkeypatch.setattr("click.prompt", lambda prompt: pytest.fail("click.prompt should not be called"))
+    assert validate_length("Enter something", max_length=5, values=["too_long_value", "ok", "fine"]) == "ok"
+    assert validate_length("Enter something", max_length=2, values=["too_long"]) is None